@@ -41,8 +41,13 @@ class Overrider:
     def get_index_of_path(self, path: Path) -> int:
         """
         Returns the first index with assignment matching the specified path.
+        Raises ValueError if there is no such assignment.
         """
-        return self.get_paths().index(path)
+        # Called upon each new assignment; scan the assignments rather than building the list of paths.
+        for index, assignment in enumerate(self._assignments):
+            if assignment.path == path:
+                return index
+        raise ValueError(f'No assignment at path {path}')
 
     def get_assignment_index(self, assignment: Optional[Assignment]):
         """
@@ -143,7 +148,7 @@ class Overrider:
         all cells in overridden indexes will be set to True.
         """
         mask = false_mask
-        for assignment in self._assignments:
+        for assignment in self._assignments[self.get_index_of_last_whole_object_assignment():]:
             path = assignment.path
             val = assignment.value is not default
             if path:
@@ -151,15 +156,27 @@ class Overrider:
                     inner_data = deep_get(mask, path[:-1])
                     if not isinstance(inner_data, np.ndarray):
                         val = recursively_run_func_on_object(lambda x: val, inner_data)
-                mask = deep_set(mask, path, val)
+                # The mask is created for this call only, so arrays can be set in place rather than copied
+                # for each assignment:
+                mask = deep_set(mask, path, val, should_copy_objects_referenced=not isinstance(mask, np.ndarray))
             else:
                 if val:
-                    mask = np.ones(np.shape(assignment.value), dtype=bool)
+                    mask = np.ones(np.shape(assignment.value), dtype=np.bool_)
                 else:
                     mask = false_mask
 
         return mask
 
+    def get_index_of_last_whole_object_assignment(self) -> int:
+        """
+        Returns the index of the last assignment to the whole object (empty path), or 0 if there is none.
+        Assignments preceding this index are fully masked by it.
+        """
+        for index in range(len(self._assignments) - 1, -1, -1):
+            if not self._assignments[index].path:
+                return index
+        return 0
+
     def get(self, path: Path) -> Assignment:
         """
         Get the assignment at the given path
@@ -178,7 +195,8 @@ class Overrider:
 
     def save_as_binary(self, file: pathlib.Path):
         with open(file, 'wb') as f:
-            pickle.dump(self._assignments, f)
+            # The highest protocol writes large numpy buffers with the fewest copies; load reads any protocol.
+            pickle.dump(self._assignments, f, protocol=pickle.HIGHEST_PROTOCOL)
 
     def load_from_binary(self, file: pathlib.Path) -> List[Path]:
         with open(file, 'rb') as f:
@@ -61,6 +61,8 @@ class ActionVerification:
 
 class FileMetaData:
 
+    __slots__ = ('file_exists', 'date')
+
     def __init__(self):
         self.file_exists: Optional[bool] = None
         self.date: Optional[float] = None
@@ -166,6 +168,8 @@ class FileSyncer(ABC):
         return ActionVerification(*cls.LOAD_LETTERCODE_TO_ACTION_BUTTON_QUESTION[code_letter.capitalize()],
                                   code_letter != code_letter.capitalize())
 
+    __slots__ = ('file_metadata', 'is_synced')
+
     def __init__(self):
         self.file_metadata: FileMetaData = FileMetaData()
         self.is_synced: bool = False
@@ -16,6 +16,8 @@ KEEP_EMPTY_FILE = Flag(False)
 
 
 class QuibFileSyncer(FileSyncer):
+    __slots__ = ('quib_ref',)
+
     def __init__(self, quib_ref: weakref.ReferenceType["Quib"]):
         self.quib_ref = quib_ref
         super(QuibFileSyncer, self).__init__()
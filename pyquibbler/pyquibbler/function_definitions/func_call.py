@@ -9,7 +9,7 @@ from pyquibbler.utilities.general_utils import Kwargs, Args
 from pyquibbler.quib.external_call_failed_exception_handling import external_call_failed_exception_handling
 from pyquibbler.path import deep_set, PathComponent
 
-from .utils import get_signature_for_func
+from .utils import get_signature_for_func, get_simple_parameters_for_func
 from .location import SourceLocation, get_object_type_locations_in_args_kwargs
 from .types import iter_arg_ids_and_values, KeywordArgument, PositionalArgument, Argument, SubArgument, ArgId, \
     convert_argument_id_to_argument
@@ -56,6 +56,27 @@ class FuncArgsKwargs:
         Given a specific function call - func, args, kwargs - return an iterator to (name, val) tuples
         of all arguments that would have been passed to the function.
         """
+        simple_parameters = get_simple_parameters_for_func(self.func)
+        if simple_parameters is not None:
+            # Bind by the parameter names, without building a signature. Anything irregular (missing, extra or
+            # duplicate arguments) is left for `Signature.bind` below, which raises the appropriate TypeError.
+            names, defaults = simple_parameters
+            args, kwargs = self.args, self.kwargs
+            if len(args) <= len(names):
+                arguments = dict(zip(names, args))
+                num_kwargs_used = 0
+                for name in names[len(args):]:
+                    if name in kwargs:
+                        arguments[name] = kwargs[name]
+                        num_kwargs_used += 1
+                    elif name not in defaults:
+                        break
+                    elif include_defaults:
+                        arguments[name] = defaults[name]
+                else:
+                    if num_kwargs_used == len(kwargs):
+                        return arguments.items()
+
         sig = get_signature_for_func(self.func)
         bound_args = sig.bind(*self.args, **self.kwargs)
 
@@ -187,13 +208,17 @@ class FuncCall(ABC):
                                     kwargs,
                                     locations: List[SourceLocation],
                                     transform_func: Callable[[Any], Any]):
+        if len(locations) == 0:
+            return args, kwargs
 
+        # args and kwargs are copied once, rather than per location, and the sources are then replaced in place:
+        new_args, new_kwargs = list(args), dict(kwargs)
         for location in locations:
             transformed = transform_func(
                 location.find_in_args_kwargs(args=self.args, kwargs=self.kwargs)
             )
-            args, kwargs = location.set_in_args_kwargs(args=args, kwargs=kwargs, value=transformed)
-        return args, kwargs
+            location.set_in_args_list_and_kwargs_dict(args=new_args, kwargs=new_kwargs, value=transformed)
+        return (tuple(new_args) if isinstance(args, tuple) else new_args), new_kwargs
 
     def transform_sources_in_args_kwargs(self,
                                          transform_data_source_func: Callable[[Any], Any] = None,
@@ -25,9 +25,10 @@ class SourceLocation(ABC):
         pass
 
     @abstractmethod
-    def set_in_args_kwargs(self, args: Args, kwargs: Kwargs, value):
+    def set_in_args_list_and_kwargs_dict(self, args: list, kwargs: dict, value):
         """
-        Given args and kwargs, set to the value referenced by the location's argument and path
+        Set the value referenced by the location's argument and path, replacing the argument in the given list or
+        dict in place. Objects nested within the argument are copied, not mutated.
         """
         pass
 
@@ -55,11 +56,11 @@ class PositionalSourceLocation(SourceLocation):
         return [PathComponent(self.argument.index), *self.path]
 
     def find_in_args_kwargs(self, args: Args, kwargs: Kwargs):
-        return deep_get(args, self.full_path)
+        return deep_get(args[self.argument.index], self.path)
 
-    def set_in_args_kwargs(self, args: Args, kwargs: Kwargs, value):
-        new_args = deep_set(args, self.full_path, value)
-        return new_args, kwargs
+    def set_in_args_list_and_kwargs_dict(self, args: list, kwargs: dict, value):
+        index = self.argument.index
+        args[index] = deep_set(args[index], self.path, value)
 
 
 class KeywordSourceLocation(SourceLocation):
@@ -70,12 +71,12 @@ class KeywordSourceLocation(SourceLocation):
     def full_path(self):
         return [PathComponent(self.argument.keyword), *self.path]
 
-    def set_in_args_kwargs(self, args: Args, kwargs: Kwargs, value):
-        new_kwargs = deep_set(kwargs, self.full_path, value)
-        return args, new_kwargs
+    def set_in_args_list_and_kwargs_dict(self, args: list, kwargs: dict, value):
+        keyword = self.argument.keyword
+        kwargs[keyword] = deep_set(kwargs[keyword], self.path, value)
 
     def find_in_args_kwargs(self, args: Args, kwargs: Kwargs):
-        return deep_get(kwargs, self.full_path)
+        return deep_get(kwargs[self.argument.keyword], self.path)
 
 
 def get_object_type_locations_in_args_kwargs(object_type, args: Args, kwargs: Kwargs) -> List[SourceLocation]:
@@ -1,16 +1,49 @@
 import functools
 import inspect
+from types import FunctionType
+from typing import Optional, Tuple, Dict, Any
 
 from .types import PositionalArgument, KeywordArgument
 
 
 @functools.lru_cache()
-def get_signature_for_func(func):
+def _get_signature_or_none_for_func(func) -> Optional[inspect.Signature]:
+    try:
+        return inspect.signature(func)
+    except ValueError:
+        # No signature can be provided (like for numpy ufuncs). We return None, rather than raise, to cache this too.
+        return None
+
+
+def get_signature_for_func(func) -> inspect.Signature:
     """
     Get the signature for a function- the reason we use this instead of immediately going to inspect is in order to
-    cache the result per function
+    cache the result per function (including the ValueError raised for functions without a signature)
+    """
+    signature = _get_signature_or_none_for_func(func)
+    if signature is None:
+        raise ValueError(f'no signature found for {func!r}')
+    return signature
+
+
+@functools.lru_cache()
+def get_simple_parameters_for_func(func) -> Optional[Tuple[Tuple[str, ...], Dict[str, Any]]]:
+    """
+    For a python function whose parameters can all be passed either by position or by keyword (no positional-only,
+    keyword-only, *args or **kwargs parameters), return the parameter names and the defaults by name, as read
+    directly from its code object. Otherwise, return None.
+    Like inspect.signature, functions are unwrapped (following `__wrapped__`) before being examined.
     """
-    return inspect.signature(func)
+    func = inspect.unwrap(func, stop=lambda f: hasattr(f, '__signature__'))
+    if not isinstance(func, FunctionType) or hasattr(func, '__signature__'):
+        return None
+    code = func.__code__
+    if code.co_flags & (inspect.CO_VARARGS | inspect.CO_VARKEYWORDS) \
+            or code.co_kwonlyargcount or code.co_posonlyargcount:
+        return None
+    names = code.co_varnames[:code.co_argcount]
+    defaults = func.__defaults__ or ()
+    return names, dict(zip(names[len(names) - len(defaults):], defaults))
 
 
 def get_parameters_for_func(func):
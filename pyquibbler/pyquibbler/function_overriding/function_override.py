@@ -3,7 +3,7 @@ import functools
 import warnings
 
 from dataclasses import dataclass
-from types import ModuleType
+from types import ModuleType, FunctionType
 from typing import Callable, Any, Dict, Union, Type, Optional, Tuple, Mapping, List
 
 from pyquibbler.exceptions import PyQuibblerException
@@ -111,12 +111,14 @@ class FuncOverride:
         # copy all public attr. this takes care of np.ufuncs like np.add.reduce, np.add.outer, etc
         # note that functools.wraps does not take care of attributes in dir but not in __dict__
         # see issue: #345
-
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")  # to avoid some "attribute was deprecated" warnings
-            for attr in dir(wrapped_func):
-                if not attr.startswith('_'):
-                    setattr(_maybe_create_quib, attr, getattr(wrapped_func, attr))
+        # (the public attributes of plain python functions are all in their __dict__, which wraps already copied)
+
+        if not isinstance(wrapped_func, FunctionType):
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")  # to avoid some "attribute was deprecated" warnings
+                for attr in dir(wrapped_func):
+                    if not attr.startswith('_'):
+                        setattr(_maybe_create_quib, attr, getattr(wrapped_func, attr))
 
         return _maybe_create_quib
 
@@ -23,6 +23,9 @@ SPECIAL_FUNCS = {
     '__getitem__': operator.getitem
 }
 
+# binary operators that also act on lists (concatenation, repetition):
+LIST_OPERATOR_NAMES = frozenset({'__add__', '__mul__'})
+
 
 def get_operator_func(func_name):
     if func_name in SPECIAL_FUNCS:
@@ -65,7 +68,7 @@ def binary_operator_override(func_name,
     func = get_operator_func(func_name)
 
     # add special translators/invertors for list addition and multiplication:
-    if func_name in ['__add__', '__mul__']:
+    if func_name in LIST_OPERATOR_NAMES:
         base_func_definition = FUNC_DEFINITION_BINARY_ELEMENTWISE_AND_LIST
     else:
         base_func_definition = FUNC_DEFINITION_BINARY_ELEMENTWISE
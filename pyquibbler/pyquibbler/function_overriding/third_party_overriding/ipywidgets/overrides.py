@@ -7,7 +7,7 @@ from pyquibbler.user_utils.obj2quib import obj2quib
 from pyquibbler.quib.quib import Quib
 from typing import Dict
 
-from pyquibbler.utilities.iterators import is_iterator_empty, iter_objects_of_type_in_object
+from pyquibbler.utilities.iterators import is_object_of_type_in_object
 
 
 TRAIT_TO_QUIBY_WIDGET_ATTR = '_quibbler_trait_to_quiby_widget'
@@ -28,7 +28,7 @@ def get_wrapper_for_trait_type_set():
     @functools.wraps(QuibyWidgetTrait.original_set)
     def quiby_set(self, obj, value):
         if isinstance(value, (list, tuple)) \
-                and not is_iterator_empty(iter_objects_of_type_in_object(object_type=Quib, obj=value)):
+                and is_object_of_type_in_object(object_type=Quib, obj=value):
             value = obj2quib(value)
 
         if isinstance(value, Quib):
@@ -19,7 +19,7 @@ from pyquibbler.quib.graphics import artist_wrapper
 
 from pyquibbler.quib.graphics.event_handling import CanvasEventHandler
 from pyquibbler.quib.graphics.event_handling.plt_plot_parser import get_xdata_arg_indices_and_ydata_arg_indices
-from pyquibbler.utilities.iterators import iter_objects_of_type_in_object_recursively, is_iterator_empty
+from pyquibbler.utilities.iterators import is_object_of_type_in_object_recursively
 from .func_definitions import FUNC_DEFINITION_GRAPHICS, FUNC_DEFINITION_GRAPHICS_AXES_SETTER
 from ..numpy.func_definitions import FUNC_DEFINITION_FILE_LOADING
 
@@ -35,7 +35,7 @@ class GraphicsOverride(FuncOverride):
 
 def transform_to_array_if_containing_quibs(obj):
     if isinstance(obj, (list, tuple)) \
-            and not is_iterator_empty(iter_objects_of_type_in_object_recursively(Quib, obj)):
+            and is_object_of_type_in_object_recursively(Quib, obj):
         return np.array(obj)
     return obj
 
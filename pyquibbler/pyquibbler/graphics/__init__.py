@@ -1,3 +1,3 @@
 from .graphics_collection import GraphicsCollection
 
-SUPPORTED_BACKENDS = {'MacOSX', 'TkAgg'}
+SUPPORTED_BACKENDS = frozenset({'MacOSX', 'TkAgg'})
@@ -7,6 +7,8 @@ import numpy as np
 
 @dataclass
 class PathComponent:
+    __slots__ = ('component',)
+
     component: Any
 
     def referencing_field_in_field_array(self, type_) -> bool:
@@ -40,6 +42,14 @@ class PathComponent:
         s = repr(self.component)
         return '{' + s + '}'
 
+    def __getstate__(self):
+        # The same state as before __slots__ was declared, so binary override files saved by earlier versions
+        # still load, and any pickle protocol can be used.
+        return {'component': self.component}
+
+    def __setstate__(self, state):
+        self.component = state['component']
+
 
 class SpecialComponent(Enum):
     WHOLE = 'whole'  # whole object
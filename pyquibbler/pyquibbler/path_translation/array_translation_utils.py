@@ -264,7 +264,9 @@ def run_func_call_with_new_args_kwargs(func_call: FuncCall, func_args_kwargs: Fu
     """
     Runs the function with the given args, kwargs
     """
-    return SourceFuncCall.from_(func_args_kwargs.func, func_args_kwargs.args, func_args_kwargs.kwargs,
-                                func_definition=func_call.func_definition,
-                                data_source_locations=[],
-                                parameter_source_locations=func_call.parameter_source_locations).run()
+    return SourceFuncCall.from_with_source_locations(func_args_kwargs.func, func_args_kwargs.args,
+                                                     func_args_kwargs.kwargs,
+                                                     func_definition=func_call.func_definition,
+                                                     data_source_locations=[],
+                                                     parameter_source_locations=func_call.parameter_source_locations
+                                                     ).run()
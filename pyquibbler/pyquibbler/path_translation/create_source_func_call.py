@@ -45,8 +45,8 @@ def get_func_call_for_translation(func_call: QuibFuncCall, with_meta_data: Optio
         transform_parameter_func=_transform_parameter_quib
     )
 
-    return SourceFuncCall.from_(func_call.func, new_args, new_kwargs,
-                                data_source_locations=func_call.data_source_locations,
-                                parameter_source_locations=func_call.parameter_source_locations,
-                                func_definition=func_call.func_definition,
-                                ), data_sources_to_quibs
+    return SourceFuncCall.from_with_source_locations(func_call.func, new_args, new_kwargs,
+                                                     func_definition=func_call.func_definition,
+                                                     data_source_locations=func_call.data_source_locations,
+                                                     parameter_source_locations=func_call.parameter_source_locations,
+                                                     ), data_sources_to_quibs
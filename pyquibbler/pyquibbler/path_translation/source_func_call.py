@@ -1,4 +1,5 @@
 from __future__ import annotations
+import operator
 from dataclasses import dataclass
 
 from typing import Callable, Optional, List
@@ -14,6 +15,10 @@ if TYPE_CHECKING:
     from pyquibbler.function_definitions.func_definition import FuncDefinition
 
 
+# replaces a source with its value
+get_source_value = operator.attrgetter('value')
+
+
 @dataclass
 class SourceFuncCall(FuncCall):
     func_definition: FuncDefinition = None
@@ -43,16 +48,27 @@ class SourceFuncCall(FuncCall):
             source_func_call.load_source_locations()
         return source_func_call
 
+    @classmethod
+    def from_with_source_locations(cls, func: Callable,
+                                   func_args: Args,
+                                   func_kwargs: Kwargs,
+                                   func_definition: FuncDefinition,
+                                   data_source_locations: List[SourceLocation],
+                                   parameter_source_locations: List[SourceLocation]):
+        """
+        Create a SourceFuncCall whose definition and source locations are already known
+        (like when translating a quib's func call), with no lookups.
+        """
+        return cls(func_args_kwargs=FuncArgsKwargs(func, func_args, func_kwargs),
+                   func_definition=func_definition,
+                   data_source_locations=data_source_locations,
+                   parameter_source_locations=parameter_source_locations)
+
     def run(self):
         """
         Calls a function with the specified args and kwargs while replacing quibs with their values.
         """
-
-        def _replace_source_with_value(source: Source):
-            return source.value
-
-        new_args, new_kwargs = self.transform_sources_in_args_kwargs(_replace_source_with_value,
-                                                                     _replace_source_with_value)
+        new_args, new_kwargs = self.transform_sources_in_args_kwargs(get_source_value, get_source_value)
         return self.func(*new_args, **new_kwargs)
 
     def __hash__(self):
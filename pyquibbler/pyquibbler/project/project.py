@@ -476,11 +476,14 @@ class Project:
         """
         Combine the pending group into the last undo group while removing Add-Remove action pairs acting on
         the same assignment.
+
+        The last undo group was already squashed when it was formed, so only the newly added Remove actions need
+        to be matched; this matters during a drag, where it is squashed again on every event.
         """
         actions = self._undo_action_groups.pop(-1)
+        remove_index = max(len(actions), 1)
         actions.extend(self._pending_undo_group)
         self._pending_undo_group = []
-        remove_index = 1
         while remove_index < len(actions):
             remove_action = actions[remove_index]
             if isinstance(remove_action, RemoveAssignmentAction):
@@ -18,11 +18,20 @@ if TYPE_CHECKING:
     from pyquibbler.quib.quib import Quib
 
 
+# Private helpers through which the public quib methods evaluate, reported under the name of the public method:
+PRIVATE_FUNC_NAMES_TO_PUBLIC_FUNC_NAMES = {
+    '_get_type': 'get_type',
+    '_get_shape': 'get_shape',
+    '_get_ndim': 'get_ndim',
+}
+
+
 def get_user_friendly_name_for_requested_evaluation(func: Callable, args: Args, kwargs: Kwargs):
     """
-    Get a user-friendly name representing the call to get_value_valid_at_path
+    Get a user-friendly name representing the call to get_value_valid_at_path.
+    Private helpers (like `_get_shape`) are reported under their public name.
     """
-    func_name = func.__name__
+    func_name = PRIVATE_FUNC_NAMES_TO_PUBLIC_FUNC_NAMES.get(func.__name__, func.__name__)
     if func_name != 'get_value_valid_at_path':
         return func_name + '()'
 
@@ -38,22 +47,36 @@ def get_user_friendly_name_for_requested_evaluation(func: Callable, args: Args,
 class ExternalCallFailedException(PyQuibblerException):
 
     def __init__(self, quibs_with_calls: List[Tuple[Quib, str], ...], exception: Exception, tb):
-        self.quibs_with_calls = quibs_with_calls
+        self._quibs_with_calls = quibs_with_calls
+        self._quibs_with_requested_evaluations: List[Tuple[Quib, Callable, Args, Kwargs]] = []
         self.exception = exception
         self.traceback = tb
 
+    def add_quib_with_requested_evaluation(self, quib: Quib, func: Callable, args: Args, kwargs: Kwargs):
+        """
+        Add a quib through which the exception propagated.
+        The exception may still be caught internally, so naming the call is deferred until it is reported.
+        """
+        self._quibs_with_requested_evaluations.append((quib, func, args, kwargs))
+
+    @property
+    def quibs_with_calls(self) -> List[Tuple[Quib, str]]:
+        return self._quibs_with_calls + [(quib, get_user_friendly_name_for_requested_evaluation(func, args, kwargs))
+                                         for quib, func, args, kwargs in self._quibs_with_requested_evaluations]
+
     def __str__(self):
-        if len(self.quibs_with_calls) == 0:
+        quibs_with_calls = self.quibs_with_calls
+        if len(quibs_with_calls) == 0:
             return ''
 
         quibs_formatted = ""
-        for quib, call in self.quibs_with_calls[::-1]:
+        for quib, call in quibs_with_calls[::-1]:
             file_info = f"File \"{quib.created_in.file_path}\", line {quib.created_in.line_no}" \
                 if quib.created_in else "Untraceable quib"
             quibs_formatted += "\n  " + file_info
             quibs_formatted += f"\n\t{repr(quib)} -> {call} "
 
-        last_quib, _ = self.quibs_with_calls[-1]
+        last_quib, _ = quibs_with_calls[-1]
         return f"Failed to execute {last_quib}\n\n" \
                f"The following quibs were in the stack of the exception: {quibs_formatted} " \
                f"\n\n{self.traceback}"
@@ -102,8 +125,7 @@ def raise_quib_call_exceptions_as_own(func):
             return func(quib, *args, **kwargs)
         except ExternalCallFailedException as e:
             # We want to remove any context
-            new_quib_with_call = (quib, get_user_friendly_name_for_requested_evaluation(func, args, kwargs))
-            e.quibs_with_calls.append(new_quib_with_call)
+            e.add_quib_with_requested_evaluation(quib, func, args, kwargs)
             raise e from None
 
     return _wrapper
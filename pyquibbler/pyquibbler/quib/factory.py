@@ -1,4 +1,5 @@
 from __future__ import annotations
+import functools
 import pathlib
 from typing import Optional, Callable, Union, Set, List
 
@@ -16,7 +17,7 @@ from .graphics import GraphicsUpdateType
 from .quib_guard import add_new_quib_to_guard_if_exists
 from .quib import Quib
 from .utils.miscellaneous import deep_copy_without_quibs_or_graphics
-from .variable_metadata import get_file_name_and_line_no, get_quib_name
+from .variable_metadata import get_file_name_and_line_no, get_quib_name, get_frame_outside_of_pyquibbler
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
@@ -55,9 +56,12 @@ def create_quib(func: Optional[Callable],
         func_definition = func_definition or get_definition_for_function(func)
 
     cache_mode = cache_mode or CachedQuibFuncCall.DEFAULT_CACHE_MODE
-    assigned_name = get_quib_name() if assigned_name is missing else assigned_name
+    # The user frame creating the quib is looked up only if the quib's name or its file and line number are needed,
+    # and then only once for both:
+    get_frame = functools.lru_cache(maxsize=None)(get_frame_outside_of_pyquibbler)
+    assigned_name = get_quib_name(get_frame) if assigned_name is missing else assigned_name
 
-    quib = Quib(created_in=get_file_name_and_line_no(),
+    quib = Quib(created_in=get_file_name_and_line_no(get_frame),
                 func=get_original_func(func),
                 args=deep_copy_without_quibs_or_graphics(args),
                 kwargs=deep_copy_without_quibs_or_graphics(kwargs),
@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import numpy as np
 from functools import wraps
+from inspect import CO_VARARGS, CO_VARKEYWORDS
 
 from typing import Callable, Any
 from pyquibbler.utilities.general_utils import Args, Kwargs
+from pyquibbler.utilities.missing_value import missing
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
@@ -12,12 +14,22 @@ if TYPE_CHECKING:
 
 
 def cache_method_until_full_invalidation(func: Callable) -> Callable:
+    """
+    Cache the result of a QuibFuncCall method until the func call is fully invalidated (see `on_type_change`).
+    The decorated method must take no arguments other than `self`, so the method itself serves as the cache key.
+    """
+    code = func.__code__
+    takes_only_self = code.co_argcount == 1 and code.co_kwonlyargcount == 0 \
+        and not code.co_flags & (CO_VARARGS | CO_VARKEYWORDS)
+    assert takes_only_self, f'{func.__qualname__} must take no arguments other than self'
+
     @wraps(func)
     def wrapper(self: QuibFuncCall):
-        if func in self.method_cache:
-            return self.method_cache[func]
-        result = func(self)
-        self.method_cache[func] = result
+        method_cache = self.method_cache
+        result = method_cache.get(func, missing)
+        if result is missing:
+            result = func(self)
+            method_cache[func] = result
         return result
 
     return wrapper
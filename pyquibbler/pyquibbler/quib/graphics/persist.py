@@ -23,6 +23,8 @@ def track_artist(artist):
 
 @dataclass
 class RunFunctionWithQuibArg(ABC):
+    __slots__ = ('weak_ref_quib',)
+
     weak_ref_quib: ReferenceType[Quib]
 
     @property
@@ -39,6 +41,7 @@ class RunFunctionWithQuibArg(ABC):
 
 
 class PersistQuibOnCreatedArtists(RunFunctionWithQuibArg):
+    __slots__ = ()
 
     @staticmethod
     def called_function(quib: Quib, new_artists: Iterable[Artist], func_args_kwargs: FuncArgsKwargs):
@@ -55,6 +58,7 @@ class PersistQuibOnCreatedArtists(RunFunctionWithQuibArg):
 
 
 class PersistQuibOnSettedArtist(RunFunctionWithQuibArg):
+    __slots__ = ()
 
     @staticmethod
     def called_function(quib: Quib, new_artists: Iterable[Artist], func_args_kwargs: FuncArgsKwargs):
@@ -105,6 +105,9 @@ def skip_canvas_draws(should_skip: bool = True):
 def _redraw_quibs_with_graphics(graphics_update: GraphicsUpdateType):
     global QUIBS_TO_REDRAW
     quib_refs = QUIBS_TO_REDRAW[graphics_update]
+    if len(quib_refs) == 0:
+        # Common after changing purely computational quibs. No need to touch the canvases.
+        return
     quibs = set(quib_refs)
     with timeit("quib redraw", f"redrawing {len(quib_refs)} quibs"), skip_canvas_draws():
         for quib in quibs:
@@ -117,6 +120,8 @@ def _redraw_quibs_with_graphics(graphics_update: GraphicsUpdateType):
 
 
 def _notify_of_overriding_changes():
+    if len(QUIBS_TO_NOTIFY_OVERRIDING_CHANGES) == 0:
+        return
     with timeit("override_notify", f"notifying overriding changes for {len(QUIBS_TO_NOTIFY_OVERRIDING_CHANGES)} quibs"):
         quibs = set(QUIBS_TO_NOTIFY_OVERRIDING_CHANGES)
         for quib in quibs:
@@ -1,14 +1,16 @@
 from __future__ import annotations
 
+import contextlib
 import copy
 import pathlib
+import sys
 import weakref
 
 import numpy as np
 
 # Typing
 from pyquibbler.utilities.general_utils import Shape, Args, Kwargs
-from typing import Set, Any, Optional, Type, List, Union, Iterable, Callable
+from typing import Set, FrozenSet, Any, Optional, Type, List, Union, Iterable, Iterator, Callable, Tuple
 
 # Matplotlib types:
 from matplotlib.artist import Artist
@@ -39,7 +41,7 @@ from pyquibbler.utilities.file_path import PathWithHyperLink
 
 # Create new quibs:
 from pyquibbler.env import LEN_BOOL_ETC_RAISE_EXCEPTION, ITER_RAISE_EXCEPTION
-from pyquibbler.utilities.iterators import recursively_run_func_on_object
+from pyquibbler.utilities.iterators import create_false_like_object
 from pyquibbler.utilities.unpacker import Unpacker
 from pyquibbler.quib.variable_metadata import get_quib_name
 
@@ -51,13 +53,13 @@ from pyquibbler.quib.quib_guard import guard_raise_if_not_allowed_access_to_quib
 from pyquibbler.function_definitions import get_definition_for_function, FuncArgsKwargs
 
 # Cache:
-from pyquibbler.cache import create_cache, CacheStatus
+from pyquibbler.cache import create_cache, CacheStatus, NdUnstructuredArrayCache
 from pyquibbler.quib.func_calling.cache_mode import CacheMode
 
 # Translations and inversion:
 from pyquibbler.utilities.multiple_instance_runner import NoRunnerWorkedException
 from pyquibbler.path_translation.translate import forwards_translate
-from pyquibbler.path import FailedToDeepAssignException, PathComponent, Path, Paths
+from pyquibbler.path import FailedToDeepAssignException, PathComponent, Path, Paths, deep_set
 from pyquibbler.path_translation.create_source_func_call import get_func_call_for_translation
 from pyquibbler.inversion.invert import invert
 
@@ -87,6 +89,42 @@ if TYPE_CHECKING:
 
 NoneType = type(None)
 
+# A shared empty path for requesting the whole value. Must never be mutated (get_value_valid_at_path only reads it).
+_EMPTY_PATH: Path = []
+
+# The proxy module cannot be imported at module level (circular import). It is imported once, upon first use.
+_GET_PARENT_OF_PROXY: Optional[Callable[[Quib], Quib]] = None
+
+
+def _get_parent_of_proxy(quib: Quib) -> Quib:
+    global _GET_PARENT_OF_PROXY
+    if _GET_PARENT_OF_PROXY is None:
+        from pyquibbler.quib.specialized_functions.proxy import get_parent_of_proxy as _GET_PARENT_OF_PROXY
+    return _GET_PARENT_OF_PROXY(quib)
+
+
+# Quib handlers whose children are pending invalidation (at the given path), while an invalidation is in progress.
+_PENDING_CHILDREN_INVALIDATIONS: Optional[List[Tuple[QuibHandler, Path]]] = None
+
+
+def _get_quibs_within_depth(quib: Quib, get_neighbours: Callable[[Quib], Set[Quib]],
+                            depth: Optional[int]) -> Set[Quib]:
+    """
+    Breadth-first search for all quibs reachable from `quib` in at most `depth` steps (`None` for unlimited).
+    Each quib is expanded once, even when it is reachable through several paths.
+    """
+    reached = set()
+    frontier = {quib}
+    while frontier and (depth is None or depth > 0):
+        next_frontier = set()
+        for frontier_quib in frontier:
+            next_frontier |= get_neighbours(frontier_quib)
+        frontier = next_frontier - reached
+        reached |= frontier
+        if depth is not None:
+            depth -= 1
+    return reached
+
 
 class QuibHandler:
     """
@@ -97,6 +135,13 @@ class QuibHandler:
     All data is stored on the QuibHandler (the Quib itself is state-less).
     """
 
+    __slots__ = ('_quib_ref', '_override_choice_cache', 'quib_function_call', 'assignment_template',
+                 'assigned_name', '_children', '_overrider', 'file_syncer', 'allow_overriding', 'assigned_quibs',
+                 'created_in_get_value_context', 'created_in', 'graphics_update', 'save_directory', 'save_format',
+                 'func_args_kwargs', 'func_definition', 'cache_mode', '_has_ever_called_get_value', '_widget',
+                 'callbacks', '_actual_save_directory_cache', '_file_name_change_deferral_count',
+                 '_is_file_name_change_pending', '_file_path_cache', '_ancestors')
+
     def __init__(self, quib: Quib, quib_function_call: QuibFuncCall,
                  assignment_template: Optional[AssignmentTemplate],
                  allow_overriding: bool,
@@ -120,8 +165,9 @@ class QuibHandler:
         self.quib_function_call = quib_function_call
 
         self.assignment_template = assignment_template
-        self.assigned_name = assigned_name
-        self.children: weakref.WeakSet[Quib] = weakref.WeakSet()
+        self.assigned_name = None if assigned_name is None else sys.intern(assigned_name)
+        self._children: weakref.WeakValueDictionary[int, Quib] = weakref.WeakValueDictionary()
+        self._ancestors: Optional[FrozenSet[Quib]] = None
         self._overrider: Optional[Overrider] = None
         self.file_syncer: QuibFileSyncer = QuibFileSyncer(quib_ref)
         self.allow_overriding = allow_overriding
@@ -131,8 +177,14 @@ class QuibHandler:
         self.graphics_update = graphics_update
 
         self.save_directory = save_directory
+        self._actual_save_directory_cache: Optional[Tuple[Optional[pathlib.Path], Optional[pathlib.Path],
+                                                          Optional[pathlib.Path]]] = None
+        self._file_path_cache: Optional[Tuple[pathlib.Path, str, SaveFormat, pathlib.Path]] = None
 
         self.save_format = save_format
+        self._file_name_change_deferral_count = 0
+        self._is_file_name_change_pending = False
+
         self.func_args_kwargs: FuncArgsKwargs = FuncArgsKwargs(func, args, kwargs)
         self.func_definition = func_definition
 
@@ -158,17 +210,74 @@ class QuibHandler:
     def parents(self) -> List[Quib]:
         return self.quib_function_call.get_data_sources() + self.quib_function_call.get_parameter_sources()
 
+    @property
+    def children(self) -> List[Quib]:
+        """
+        A snapshot of the quibs dependent on this quib, safe to iterate while children are added or removed.
+        """
+        return list(self._children.values())
+
+    def iter_descendants(self) -> Iterator[Quib]:
+        """
+        Yield all downstream quibs, each one once, without building the full set.
+        """
+        seen = set()
+        stack = self.children
+        while stack:
+            quib = stack.pop()
+            if quib in seen:
+                continue
+            seen.add(quib)
+            yield quib
+            stack.extend(quib.handler.children)
+
+    def iter_ancestors(self) -> Iterator[Quib]:
+        """
+        Yield all upstream quibs, each one once, without building the full set.
+        """
+        seen = set()
+        stack = self.parents
+        while stack:
+            quib = stack.pop()
+            if quib in seen:
+                continue
+            seen.add(quib)
+            yield quib
+            stack.extend(quib.handler.parents)
+
+    @property
+    def ancestors(self) -> FrozenSet[Quib]:
+        """
+        All upstream quibs. Computed once, as the parents of a quib never change.
+        Ancestors whose own ancestors are already known are not traversed.
+        """
+        if self._ancestors is None:
+            ancestors = set()
+            stack = self.parents
+            while stack:
+                quib = stack.pop()
+                if quib in ancestors:
+                    continue
+                ancestors.add(quib)
+                known_ancestors = quib.handler._ancestors
+                if known_ancestors is None:
+                    stack.extend(quib.handler.parents)
+                else:
+                    ancestors |= known_ancestors
+            self._ancestors = frozenset(ancestors)
+        return self._ancestors
+
     def add_child(self, quib: Quib) -> None:
         """
         Add the given quib to the list of quibs that are dependent on this quib.
         """
-        self.children.add(quib)
+        self._children[id(quib)] = quib
 
     def remove_child(self, quib_to_remove: Quib):
         """
         Removes a child from the quib, no longer sending invalidations to it
         """
-        self.children.remove(quib_to_remove)
+        del self._children[id(quib_to_remove)]
 
     def connect_to_parents(self):
         """
@@ -255,10 +364,24 @@ class QuibHandler:
     def _invalidate_children_at_path(self, path: Path) -> None:
         """
         Change this quib's state according to a change in a dependency.
+
+        Rather than recursing down the graph, the quibs whose children are yet to be invalidated are kept on an
+        explicit stack. Calls made while the stack is being processed just push onto it.
         """
-        for child in set(self.children):  # We copy of the set because children can change size during iteration
+        global _PENDING_CHILDREN_INVALIDATIONS
+        if _PENDING_CHILDREN_INVALIDATIONS is not None:
+            _PENDING_CHILDREN_INVALIDATIONS.append((self, path))
+            return
 
-            child.handler._invalidate_quib_with_children_at_path(self.quib, path)
+        _PENDING_CHILDREN_INVALIDATIONS = pending = [(self, path)]
+        try:
+            while pending:
+                handler, path = pending.pop()
+                invalidator_quib = handler.quib
+                for child in handler.children:
+                    child.handler._invalidate_quib_with_children_at_path(invalidator_quib, path)
+        finally:
+            _PENDING_CHILDREN_INVALIDATIONS = None
 
     def _invalidate_quib_with_children_at_path(self, invalidator_quib: Quib, path: Path):
         """
@@ -275,20 +398,26 @@ class QuibHandler:
         func_call, sources_to_quibs = get_func_call_for_translation(self.quib_function_call, with_meta_data=None)
 
         # a quib can appear more than once in the data sources. For example, np.concatenate((w, w))
-        invalidator_quib_indices = [i for i, quib in enumerate(list(sources_to_quibs.values()))
-                                    if quib is invalidator_quib]
+        sources_of_invalidator_quib = [(i, source) for i, (source, quib) in enumerate(sources_to_quibs.items())
+                                       if quib is invalidator_quib]
+
+        # The shape, type and metadata are the same for all appearances; get them once:
+        shape = self.quib_function_call.get_shape()
+        type_ = self.quib_function_call.get_type()
+        result_metadata = self.quib_function_call.get_result_metadata()
+        data_source_locations = self.quib_function_call.data_source_locations
 
         invalidation_paths = []
-        for invalidator_quib_index in invalidator_quib_indices:
+        for invalidator_quib_index, source in sources_of_invalidator_quib:
             invalidation_paths_of_current_invalidator_quib_appearance = \
                 forwards_translate(
                     func_call=func_call,
-                    source=list(sources_to_quibs)[invalidator_quib_index],
-                    source_location=self.quib_function_call.data_source_locations[invalidator_quib_index],
+                    source=source,
+                    source_location=data_source_locations[invalidator_quib_index],
                     path=path,
-                    shape=self.quib_function_call.get_shape(),
-                    type_=self.quib_function_call.get_type(),
-                    **self.quib_function_call.get_result_metadata()
+                    shape=shape,
+                    type_=type_,
+                    **result_metadata
                 )
             invalidation_paths.extend(invalidation_paths_of_current_invalidator_quib_appearance)
         return invalidation_paths
@@ -426,7 +555,7 @@ class QuibHandler:
         func_call, data_sources_to_quibs = get_func_call_for_translation(self.quib_function_call, with_meta_data=True)
 
         try:
-            value = self.get_value_valid_at_path([])
+            value = self.get_value_valid_at_path(_EMPTY_PATH)
             # TODO: better implement with the line below. But need to take care of out-of-range assignments:
             # value = self.get_value_valid_at_path(assignment.path)
 
@@ -465,8 +594,11 @@ class QuibHandler:
             if assignment.value is not default:
                 # Our cache only accepts shallow paths, so any validation to a non-shallow path is not necessarily
                 # overridden at the first component completely- so we ignore it
-                if len(assignment.path) <= 1:
+                if len(assignment.path) == 0:
+                    # the value becomes the cache's own value, which later assignments set into
                     cache.set_valid_value_at_path(assignment.path, copy.deepcopy(assignment.value))
+                elif len(assignment.path) == 1:
+                    cache.set_valid_value_at_path(assignment.path, assignment.value)
             else:
                 # Our cache only accepts shallow paths, so we need to consider any invalidation to a path deeper
                 # than one component as an invalidation to the entire first component of that path
@@ -482,6 +614,25 @@ class QuibHandler:
 
         return cache
 
+    @staticmethod
+    def _get_invalid_mask_of_array_assignments(shape, assignments) -> Optional[np.ndarray]:
+        """
+        Replay the assignments of an unstructured array on a boolean mask alone (True where not overridden),
+        following the same rules as `_apply_assignment_to_cache` without copying or setting any values.
+        Returns None if an assignment replaces the whole array with a value of a different shape.
+        """
+        invalid_mask = np.full(shape, True)
+        for assignment in assignments:
+            is_removal = assignment.value is default
+            if len(assignment.path) == 0:
+                if not is_removal and np.shape(assignment.value) != shape:
+                    return None
+                invalid_mask = np.full(shape, is_removal)
+            elif len(assignment.path) == 1 or is_removal:
+                invalid_mask = deep_set(invalid_mask, assignment.path[:1], is_removal,
+                                        should_copy_objects_referenced=False)
+        return invalid_mask
+
     def _get_list_of_not_overridden_paths_at_first_component(self, path) -> Paths:
         """
         Get a list of all the non overridden paths (at the first component)
@@ -490,8 +641,17 @@ class QuibHandler:
         if not self.is_overridden:
             return [path]
 
-        assignments = self.overrider.get_assignments()
-        original_value = copy.deepcopy(self.get_value_valid_at_path(None))
+        # Assignments preceding the last whole-object assignment are masked by it, so we need not replay them:
+        overrider = self.overrider
+        assignments = overrider.get_assignments()[overrider.get_index_of_last_whole_object_assignment():]
+        value = self.get_value_valid_at_path(None)
+        if NdUnstructuredArrayCache.supports_result(value):
+            # Only validity matters here, so arrays can be replayed on a mask without copying the value:
+            invalid_mask = self._get_invalid_mask_of_array_assignments(value.shape, assignments)
+            if invalid_mask is not None:
+                return NdUnstructuredArrayCache(value, invalid_mask=invalid_mask).get_uncached_paths(path)
+
+        original_value = copy.deepcopy(value)
         cache = create_cache(original_value)
         for assignment in assignments:
             cache = self._apply_assignment_to_cache(original_value, cache, assignment)
@@ -505,7 +665,8 @@ class QuibHandler:
         """
         Get the actual data that this quib represents, valid at the path given in the argument.
         The value will necessarily return in the shape of the actual result, but only the values at the given path
-        are guaranteed to be valid
+        are guaranteed to be valid.
+        The given path is not mutated (get_value passes a shared empty path).
         """
         if WARN_ON_UNSUPPORTED_BACKEND and self.func_definition.is_graphics:
             from matplotlib.pyplot import get_backend
@@ -543,13 +704,75 @@ class QuibHandler:
     def actual_save_format(self):
         return self.save_format if self.save_format else self.project.save_format
 
+    @property
+    def actual_save_directory(self) -> Optional[pathlib.Path]:
+        # The result is cached together with the project directory and the quib's save_directory it was derived
+        # from. Both are immutable paths that are replaced (not mutated) upon change, so identity checks suffice.
+        project_directory = self.project.directory
+        save_directory = self.save_directory
+        cache = self._actual_save_directory_cache
+        if cache is not None and cache[0] is project_directory and cache[1] is save_directory:
+            return cache[2]
+
+        if save_directory is not None and save_directory.is_absolute():
+            actual_save_directory = save_directory  # absolute directory
+        elif project_directory is None:
+            actual_save_directory = None
+        else:
+            actual_save_directory = project_directory if save_directory is None \
+                else project_directory / save_directory
+
+        self._actual_save_directory_cache = (project_directory, save_directory, actual_save_directory)
+        return actual_save_directory
+
+    @property
+    def file_path(self) -> Optional[pathlib.Path]:
+        # Same caching scheme as actual_save_directory: the path is rebuilt only when one of the objects it is
+        # derived from is replaced (assigned names are interned, save formats are enum members).
+        # Most quibs are unnamed, so the name is checked before the project is consulted for directory and format.
+        assigned_name = self.assigned_name
+        if assigned_name is None:
+            return None
+        actual_save_directory = self.actual_save_directory
+        if actual_save_directory is None:
+            return None
+        actual_save_format = self.actual_save_format
+        if actual_save_format is None:
+            return None
+
+        cache = self._file_path_cache
+        if cache is not None and cache[0] is actual_save_directory and cache[1] is assigned_name \
+                and cache[2] is actual_save_format:
+            return cache[3]
+
+        file_path = actual_save_directory / (assigned_name + SAVE_FORMAT_TO_FILE_EXT[actual_save_format])
+        self._file_path_cache = (actual_save_directory, assigned_name, actual_save_format, file_path)
+        return file_path
+
     def on_project_directory_change(self):
         if not (self.save_directory is not None and self.save_directory.is_absolute()):
             self.file_syncer.on_file_name_changed()
 
     def on_file_name_change(self):
+        if self._file_name_change_deferral_count > 0:
+            self._is_file_name_change_pending = True
+            return
         self.file_syncer.on_file_name_changed()
 
+    @contextlib.contextmanager
+    def defer_file_name_change(self):
+        """
+        Notify the file syncer at most once for all file-name changes made within the context.
+        """
+        self._file_name_change_deferral_count += 1
+        try:
+            yield
+        finally:
+            self._file_name_change_deferral_count -= 1
+            if self._file_name_change_deferral_count == 0 and self._is_file_name_change_pending:
+                self._is_file_name_change_pending = False
+                self.file_syncer.on_file_name_changed()
+
     def save_assignments_or_value(self, file_path: pathlib.Path):
         if self.actual_save_format is SaveFormat.OFF:
             return
@@ -623,6 +846,13 @@ class Quib:
     A Quib represents the output of a call to a specific function with specific arguments.
     """
 
+    __slots__ = ('handler', '__weakref__')
+
+    # Quibs are hashed and compared by identity (sets of quibs are sets of distinct quib objects).
+    # `__ne__`, `__lt__` etc. are overridden to create new quibs, but these two must stay the fast object defaults:
+    __hash__ = object.__hash__
+    __eq__ = object.__eq__
+
     def __init__(self,
                  quib_function_call: QuibFuncCall = None,
                  assignment_template: Optional[AssignmentTemplate] = None,
@@ -1266,11 +1496,12 @@ class Quib:
             >>> b = (2 * a).setp(allow_overriding=True, assigned_name='two_times_a')
         """
 
-        for attr_name in ['allow_overriding', 'save_directory', 'save_format',
-                          'cache_mode', 'assigned_name', 'name', 'graphics_update', 'assigned_quibs']:
-            value = eval(attr_name)
-            if value is not missing:
-                setattr(self, attr_name, value)
+        with self.handler.defer_file_name_change():
+            for attr_name in ['allow_overriding', 'save_directory', 'save_format',
+                              'cache_mode', 'assigned_name', 'name', 'graphics_update', 'assigned_quibs']:
+                value = eval(attr_name)
+                if value is not missing:
+                    setattr(self, attr_name, value)
         if assignment_template is not missing:
             self.set_assignment_template(assignment_template)
 
@@ -1426,9 +1657,8 @@ class Quib:
         >>> b.get_value()  # the calculation only occurs when the quib value is requested
         9
         """
-        return self.handler.get_value_valid_at_path([])
+        return self.handler.get_value_valid_at_path(_EMPTY_PATH)
 
-    @raise_quib_call_exceptions_as_own
     def get_type(self) -> Type:
         """
         Return the type of the quib's value.
@@ -1448,9 +1678,15 @@ class Quib:
         -----
         Calculating the type of a quib does not necessarily require calculating its entire value.
         """
-        return self.handler.quib_function_call.get_type()
+        result_type = self.handler.quib_function_call.result_type
+        if result_type is not None:
+            return result_type
+        return self._get_type()
 
     @raise_quib_call_exceptions_as_own
+    def _get_type(self) -> Type:
+        return self.handler.quib_function_call.get_type()
+
     def get_shape(self) -> Shape:
         """
         Return the shape of the quib's value.
@@ -1470,9 +1706,15 @@ class Quib:
         -----
         Calculating the shape of a quib does not necessarily require calculating its entire value.
         """
-        return self.handler.quib_function_call.get_shape()
+        result_shape = self.handler.quib_function_call.result_shape
+        if result_shape is not None:
+            return result_shape
+        return self._get_shape()
 
     @raise_quib_call_exceptions_as_own
+    def _get_shape(self) -> Shape:
+        return self.handler.quib_function_call.get_shape()
+
     def get_ndim(self) -> int:
         """
         Return the number of dimensions of the quib's value.
@@ -1492,6 +1734,13 @@ class Quib:
         -----
         Calculating ndim of a quib does not necessarily require calculating its entire value.
         """
+        result_shape = self.handler.quib_function_call.result_shape
+        if result_shape is not None:
+            return len(result_shape)
+        return self._get_ndim()
+
+    @raise_quib_call_exceptions_as_own
+    def _get_ndim(self) -> int:
         return self.handler.quib_function_call.get_ndim()
 
     """
@@ -1613,12 +1862,13 @@ class Quib:
         # Method gets overridden by `create_quib_method_overrides`, which makes it quiby with pass-quibs=True
         # So self is a proxy quib of the original "self" quib.
         #
-        from pyquibbler.quib.specialized_functions.proxy import get_parent_of_proxy
-        quib = get_parent_of_proxy(self)
+        quib = _get_parent_of_proxy(self)
         if issubclass(quib.get_type(), np.ndarray):
-            mask = np.zeros(quib.get_shape(), dtype=bool)
+            mask = np.zeros(quib.get_shape(), dtype=np.bool_)
         else:
-            mask = recursively_run_func_on_object(func=lambda x: False, obj=quib.get_value())
+            mask = create_false_like_object(quib.get_value())
+        if not quib.handler.is_overridden:
+            return mask
         return quib.handler.overrider.fill_override_mask(mask)
 
     """
@@ -1663,9 +1913,15 @@ class Quib:
             return children
 
         named_children = set()
-        for child in children:
+        visited = set()
+        stack = list(children)
+        while stack:
+            child = stack.pop()
+            if child in visited:
+                continue
+            visited.add(child)
             if child.assigned_name is None and not child.is_graphics_quib:
-                named_children |= child.get_children(bypass_intermediate_quibs)
+                stack.extend(child.handler.children)
             else:
                 named_children.add(child)
         return named_children
@@ -1709,13 +1965,10 @@ class Quib:
         >>> a.get_descendants(True)
         {b = a + 1, c = (a + 2) * b, d = b * (c + 1)}
         """
-        descendants = set()
-        if depth is None or depth > 0:
-            for child in self.get_children(bypass_intermediate_quibs):
-                descendants.add(child)
-                descendants |= child.get_descendants(bypass_intermediate_quibs,
-                                                     depth if depth is None else depth - 1)
-        return descendants
+        if depth is None and not bypass_intermediate_quibs:
+            return set(self.handler.iter_descendants())
+
+        return _get_quibs_within_depth(self, lambda quib: quib.get_children(bypass_intermediate_quibs), depth)
 
     @validate_user_input(bypass_intermediate_quibs=bool, is_data_source=(NoneType, bool))
     def get_parents(self, bypass_intermediate_quibs: bool = False, is_data_source: Optional[bool] = None) -> Set[Quib]:
@@ -1768,9 +2021,15 @@ class Quib:
             return parents
 
         named_parents = set()
-        for parent in parents:
+        visited = set()
+        stack = list(parents)
+        while stack:
+            parent = stack.pop()
+            if parent in visited:
+                continue
+            visited.add(parent)
             if parent.assigned_name is None and not parent.is_graphics_quib:
-                named_parents |= parent.get_parents(bypass_intermediate_quibs)
+                stack.extend(parent.handler.parents)
             else:
                 named_parents.add(parent)
         return named_parents
@@ -1813,13 +2072,11 @@ class Quib:
         >>> c.get_ancestors(True)
         {a = iquib(1), b = iquib(3)}
         """
-        ancestors = set()
-        if depth is None or depth > 0:
-            for parent in self.get_parents(bypass_intermediate_quibs):
-                ancestors.add(parent)
-                ancestors |= parent.get_ancestors(bypass_intermediate_quibs,
-                                                  depth if depth is None else depth - 1)
-        return ancestors
+        if depth is None and not bypass_intermediate_quibs:
+            return set(self.handler.ancestors)
+
+        return _get_quibs_within_depth(self, lambda quib: quib.get_parents(bypass_intermediate_quibs), depth)
+
     """
     File saving
     """
@@ -1904,19 +2161,19 @@ class Quib:
 
     def _get_file_path(self, response_to_file_not_defined: ResponseToFileNotDefined = ResponseToFileNotDefined.IGNORE) \
             -> Optional[PathWithHyperLink]:
-        if self.assigned_name is None or self.actual_save_directory is None or self.actual_save_format is None:
-            path = None
-            exception = FileNotDefinedException(
-                self.assigned_name, self.actual_save_directory, self.actual_save_format)
-            if response_to_file_not_defined == ResponseToFileNotDefined.RAISE:
-                raise exception
-            elif response_to_file_not_defined == ResponseToFileNotDefined.WARN \
-                    or response_to_file_not_defined == ResponseToFileNotDefined.WARN_IF_DATA \
-                    and self.handler.is_overridden:
+        path = self.handler.file_path
+        if path is None:
+            # Project-wide save/load/sync reach here for every unnamed quib; only build the exception when reported.
+            should_raise = response_to_file_not_defined == ResponseToFileNotDefined.RAISE
+            should_warn = response_to_file_not_defined == ResponseToFileNotDefined.WARN \
+                or response_to_file_not_defined == ResponseToFileNotDefined.WARN_IF_DATA \
+                and self.handler.is_overridden
+            if should_raise or should_warn:
+                exception = FileNotDefinedException(
+                    self.assigned_name, self.actual_save_directory, self.actual_save_format)
+                if should_raise:
+                    raise exception
                 no_header_warn(str(exception))
-        else:
-            path = self.actual_save_directory \
-                   / (self.assigned_name + SAVE_FORMAT_TO_FILE_EXT[self.actual_save_format])
 
         return path
 
@@ -1967,14 +2224,7 @@ class Quib:
         Project.directory
         SaveFormat
         """
-        save_directory = self.handler.save_directory
-        if save_directory is not None and save_directory.is_absolute():
-            return save_directory  # absolute directory
-        elif self.project.directory is None:
-            return None
-        else:
-            return self.project.directory if save_directory is None \
-                else self.project.directory / save_directory
+        return self.handler.actual_save_directory
 
     def save(self,
              response_to_file_not_defined: ResponseToFileNotDefined = ResponseToFileNotDefined.RAISE,
@@ -2090,7 +2340,7 @@ class Quib:
                                                 'and continuing with alpha-numeric characters or spaces.'
                                                 )
 
-        self.handler.assigned_name = assigned_name
+        self.handler.assigned_name = None if assigned_name is None else sys.intern(assigned_name)
         self.handler.on_file_name_change()
         self.handler.on_name_change()
 
@@ -2273,20 +2523,26 @@ class Quib:
         >>> b.functional_representation
         'b = (a + 10) ** 2'
         """
-        return f"{self.assigned_name} = {self.functional_representation}" \
-            if self.assigned_name is not None else self.functional_representation
+        assigned_name = self.handler.assigned_name
+        return self.functional_representation if assigned_name is None \
+            else f"{assigned_name} = {self.functional_representation}"
 
     def __repr__(self):
         return str(self)
 
     def __str__(self):
-        if PRETTY_REPR:
-            if REPR_RETURNS_SHORT_NAME:
-                return str(self.get_math_expression())
-            elif REPR_WITH_OVERRIDES and self.handler.is_overridden:
-                return self.pretty_repr + '\n' + self.handler.overrider.get_pretty_repr(self.assigned_name)
-            return self.pretty_repr
-        return self.ugly_repr
+        # The repr flags are toggled temporarily while building math expressions, so they are read on each call.
+        # We read their `val` directly to avoid the Flag.__bool__ call.
+        if not PRETTY_REPR.val:
+            return self.ugly_repr
+        if REPR_RETURNS_SHORT_NAME.val:
+            assigned_name = self.handler.assigned_name
+            if assigned_name is not None:
+                return assigned_name  # no need to build the functional representation
+            return str(self._get_functional_representation_expression())
+        if REPR_WITH_OVERRIDES.val and self.handler.is_overridden:
+            return self.pretty_repr + '\n' + self.handler.overrider.get_pretty_repr(self.assigned_name)
+        return self.pretty_repr
 
     def display_properties(self) -> QuibPropertiesViewer:
         """
@@ -52,6 +52,8 @@ add_definition_for_function(func=proxy, func_definition=proxy_definition, quib_c
 
 
 def get_parent_of_proxy(quib: Quib):
-    while quib.func is proxy:
-        quib = quib.args[0]
+    func_args_kwargs = quib.handler.func_args_kwargs
+    while func_args_kwargs.func is proxy:
+        quib = func_args_kwargs.args[0]
+        func_args_kwargs = quib.handler.func_args_kwargs
     return quib
@@ -9,6 +9,8 @@ class FileAndLineNumber:
     Points to a specific line number within a specified file.
     """
 
+    __slots__ = ('file_path', 'line_no')
+
     file_path: str
     line_no: Optional[int]
 
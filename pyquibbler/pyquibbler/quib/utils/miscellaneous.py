@@ -1,10 +1,13 @@
 from copy import copy
 from typing import Any, Optional
 
+from matplotlib.artist import Artist
+from matplotlib.widgets import AxesWidget
+
 from pyquibbler.env import DEBUG
-from pyquibbler.utilities.iterators import is_iterator_empty, recursively_run_func_on_object, \
-    SHALLOW_MAX_LENGTH, SHALLOW_MAX_DEPTH
-from .iterators import iter_quibs_in_object, iter_quibs_in_args, iter_quibs_in_object_recursively
+from pyquibbler.utilities.iterators import is_object_of_type_in_object, is_object_of_type_in_args_kwargs, \
+    recursively_run_func_on_object, SHALLOW_MAX_LENGTH, SHALLOW_MAX_DEPTH, LEAF_TYPES
+from .iterators import iter_quibs_in_object_recursively
 from ..exceptions import NestedQuibException
 
 
@@ -12,7 +15,8 @@ def is_there_a_quib_in_object(obj, recursive: bool = False):
     """
     Returns true if there is a quib object nested inside the given object.
     """
-    return not is_iterator_empty(iter_quibs_in_object(obj, recursive))
+    from pyquibbler.quib.quib import Quib
+    return is_object_of_type_in_object(Quib, obj, recursive)
 
 
 def is_there_a_quib_in_args(args, kwargs):
@@ -20,16 +24,16 @@ def is_there_a_quib_in_args(args, kwargs):
     Returns true if there is a quib object nested inside the given args and kwargs and false otherwise.
     For use by function wrappers that need to determine if the underlying function was called with a quib.
     """
-    return not is_iterator_empty(iter_quibs_in_args(args, kwargs))
+    from pyquibbler.quib.quib import Quib
+    return is_object_of_type_in_args_kwargs(Quib, args, kwargs)
 
 
 def deep_copy_without_quibs_or_graphics(obj: Any, max_depth: Optional[int] = None, max_length: Optional[int] = None):
-    from matplotlib.artist import Artist
-    from matplotlib.widgets import AxesWidget
     from pyquibbler.quib.quib import Quib
 
     def copy_if_not_quib_or_artist(o):
-        if isinstance(o, (Quib, Artist, AxesWidget)) or callable(o):
+        # leaf types are immutable, so there is nothing to copy:
+        if type(o) in LEAF_TYPES or isinstance(o, (Quib, Artist, AxesWidget)) or callable(o):
             return o
         return copy(o)
 
@@ -42,10 +46,11 @@ def copy_and_replace_quibs_with_vals(obj: Any):
     Copy `obj` while replacing quibs with their values, with a limited depth and length.
     """
     from pyquibbler.quib.quib import Quib
-    from matplotlib.widgets import AxesWidget
-    from matplotlib.artist import Artist
 
     def replace_with_value_if_quib_or_copy(o):
+        if type(o) in LEAF_TYPES:
+            # immutable, no need to copy
+            return o
         if isinstance(o, Quib):
             return o.get_value()
         if isinstance(o, (Artist, AxesWidget)):
@@ -59,6 +64,6 @@ def copy_and_replace_quibs_with_vals(obj: Any):
                                             max_length=SHALLOW_MAX_LENGTH, obj=obj)
     if DEBUG:
         nested_quibs = set(iter_quibs_in_object_recursively(result))
-        if is_there_a_quib_in_object(result, recursive=True):
+        if nested_quibs:
             raise NestedQuibException(obj, nested_quibs)
     return result
@@ -1,8 +1,14 @@
 import ast
+import functools
+import os
+import sys
+import sysconfig
+import weakref
 from dataclasses import dataclass
-from typing import Optional
+from types import FrameType
+from typing import Optional, Callable
 
-from varname.utils import ASSIGN_TYPES, get_node, node_name, AssignType
+from varname.utils import ASSIGN_TYPES, get_node_by_frame, node_name, AssignType
 
 from pyquibbler.env import GET_VARIABLE_NAMES, SHOW_QUIB_EXCEPTIONS_AS_QUIB_TRACEBACKS
 from pyquibbler.debug_utils.logger import logger
@@ -11,6 +17,18 @@ from .types import FileAndLineNumber
 
 AST_ASSIGNMENTS_TO_VAR_NAME_STATES = {}
 
+# Variable names of single-target assignments, keyed by the code object and last instruction of the frame creating
+# the quib. Repeated calls from the same line (e.g. in a loop) skip the ast analysis.
+# Code objects are weakly referenced, so that entries are dropped together with the code that created them.
+CODE_OBJECTS_TO_VAR_NAMES_BY_INSTRUCTION: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+# As in the default ignore list of varname, frames of the standard library and of varname itself are ignored too
+IGNORED_MODULES = ('pyquibbler', 'matplotlib', 'varname')
+
+STDLIB_PATH = os.path.join(os.path.realpath(sysconfig.get_path('stdlib')), '')
+
+THIRD_PARTY_LIBS_PATH = os.path.join(STDLIB_PATH, 'site-packages', '')
+
 
 @dataclass
 class VarNameState:
@@ -29,35 +47,68 @@ def find_relevant_parent_assignment_node(node: ast.AST) -> AssignType:
     return None
 
 
-def get_quib_node_being_set_outside_of_pyquibbler():
-    import pyquibbler
-    import matplotlib
-    return get_node(frame=1, ignore=[pyquibbler, matplotlib], raise_exc=False)
+@functools.lru_cache()
+def _is_stdlib_file(file_name: str) -> bool:
+    file_name = os.path.realpath(file_name)
+    return file_name.startswith(STDLIB_PATH) and not file_name.startswith(THIRD_PARTY_LIBS_PATH)
+
+
+def _is_frame_ignored(frame: FrameType) -> bool:
+    module_name = frame.f_globals.get('__name__') or ''
+    return module_name.split('.', 1)[0] in IGNORED_MODULES \
+        or frame.f_code.co_name == '<lambda>' \
+        or _is_stdlib_file(frame.f_code.co_filename)
+
+
+def get_frame_outside_of_pyquibbler() -> Optional[FrameType]:
+    """
+    Return the first frame up the stack which is not within pyquibbler, matplotlib, varname or the standard library
+    (or a lambda function).
+    We walk the frames directly, rather than using inspect, which builds frame-info objects for the entire stack.
+    """
+    frame = sys._getframe(1)
+    while frame is not None and _is_frame_ignored(frame):
+        frame = frame.f_back
+    return frame
+
+
+def get_quib_node_being_set_outside_of_pyquibbler(frame: Optional[FrameType] = None):
+    frame = frame or get_frame_outside_of_pyquibbler()
+    if frame is None:
+        return None
+    return get_node_by_frame(frame, raise_exc=False)
 
 
-def get_file_name_and_line_number_of_quib() -> Optional[FileAndLineNumber]:
-    refnode = get_quib_node_being_set_outside_of_pyquibbler()
-    if refnode is None:
+def get_file_name_and_line_number_of_quib(frame: Optional[FrameType] = None) -> Optional[FileAndLineNumber]:
+    frame = frame or get_frame_outside_of_pyquibbler()
+    if frame is None:
         return None
-    frame = refnode.__frame__
     file_name = frame.f_code.co_filename
     line_number = frame.f_lineno
     return FileAndLineNumber(file_name, line_number)
 
 
-def get_var_name_being_set_outside_of_pyquibbler() -> Optional[str]:
+def get_var_name_being_set_outside_of_pyquibbler(frame: Optional[FrameType] = None) -> Optional[str]:
     """
     Get the current variable name being set outside of pyquibbler.
     If none is found, return None.
     This is not thread safe, as it keeps track_and_handle_new_graphics of the current line being accessed and which
      variable is being set in that line (eg a, b = iquib(1), iquib(2))
     """
-    refnode = get_quib_node_being_set_outside_of_pyquibbler()
+    frame = frame or get_frame_outside_of_pyquibbler()
+    if frame is None:
+        return None
+    instructions_to_var_names = CODE_OBJECTS_TO_VAR_NAMES_BY_INSTRUCTION.setdefault(frame.f_code, {})
+    if frame.f_lasti in instructions_to_var_names:
+        return instructions_to_var_names[frame.f_lasti]
+
+    refnode = get_quib_node_being_set_outside_of_pyquibbler(frame)
     if not refnode:
         return None
     node = find_relevant_parent_assignment_node(refnode)
 
     if not node:
+        instructions_to_var_names[frame.f_lasti] = None
         return None
 
     if isinstance(node, ast.Assign):
@@ -72,6 +123,11 @@ def get_var_name_being_set_outside_of_pyquibbler() -> Optional[str]:
     if not isinstance(names, tuple):
         names = (names,)
 
+    if len(names) == 1:
+        # Multiple-target assignments are resolved by order of creation (see below), and thus cannot be cached
+        instructions_to_var_names[frame.f_lasti] = names[0]
+        return names[0]
+
     AST_ASSIGNMENTS_TO_VAR_NAME_STATES.setdefault(node, VarNameState(current_var_count=0, total_var_count=len(names)))
     var_name_state = AST_ASSIGNMENTS_TO_VAR_NAME_STATES.get(node)
     current_name = names[var_name_state.current_var_count]
@@ -82,28 +138,31 @@ def get_var_name_being_set_outside_of_pyquibbler() -> Optional[str]:
     return current_name
 
 
-def get_quib_name() -> Optional[str]:
+def get_quib_name(get_frame: Callable[[], Optional[FrameType]] = get_frame_outside_of_pyquibbler) -> Optional[str]:
     """
     Get the quib's name- this can potentially return None
-    if the context makes getting the file name and line no irrelevant
+    if the context makes getting the file name and line no irrelevant.
+    `get_frame` is only called if the name is needed.
     """
     if GET_VARIABLE_NAMES and not is_within_get_value_context():
         try:
-            return get_var_name_being_set_outside_of_pyquibbler()
+            return get_var_name_being_set_outside_of_pyquibbler(get_frame())
         except Exception as e:
             logger.warning(f"Failed to get name, exception:\n{e}")
 
     return None
 
 
-def get_file_name_and_line_no() -> Optional[FileAndLineNumber]:
+def get_file_name_and_line_no(get_frame: Callable[[], Optional[FrameType]] = get_frame_outside_of_pyquibbler) \
+        -> Optional[FileAndLineNumber]:
     """
     Get the file name and line no where the quib was created (outside of pyquibbler)- this can potentially return Nones
-    if the context makes getting the file name and line no irrelevant
+    if the context makes getting the file name and line no irrelevant.
+    `get_frame` is only called if the file name and line no are needed.
     """
     if SHOW_QUIB_EXCEPTIONS_AS_QUIB_TRACEBACKS and not is_within_get_value_context():
         try:
-            return get_file_name_and_line_number_of_quib()
+            return get_file_name_and_line_number_of_quib(get_frame())
         except Exception as e:
             logger.warning(f"Failed to get file name + lineno, exception:\n{e}")
 
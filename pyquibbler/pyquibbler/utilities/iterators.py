@@ -1,3 +1,5 @@
+import functools
+
 import numpy as np
 from dataclasses import dataclass
 
@@ -14,6 +16,10 @@ from pyquibbler.path import Path, PathComponent, Paths
 SHALLOW_MAX_DEPTH = 2
 SHALLOW_MAX_LENGTH = 100
 
+# Exact types that never need to be recursed into. Checked by `type(obj) in LEAF_TYPES`, a single set lookup, before
+# the isinstance checks for the composite types (which all miss for these common arguments):
+LEAF_TYPES = frozenset({int, float, complex, bool, str, bytes, type(None), np.int64, np.float64, np.bool_})
+
 
 @dataclass
 class CannotCastObjectByOtherObjectException(PyQuibblerException):
@@ -37,6 +43,87 @@ def recursively_replace_objects_in_object(func: Callable, obj: Any):
         return np.array((recursively_replace_objects_in_object(func, sub_obj) for sub_obj in obj), dtype=object)
 
 
+def _get_sub_objects_to_scan(obj: Any, max_length: Optional[int]) -> Optional[tuple]:
+    """
+    Return the sub-objects of a composite object that are scanned for nested objects,
+    or None if `obj` is not scanned into.
+    """
+    if type(obj) in LEAF_TYPES:
+        return None
+    if isinstance(obj, slice):
+        obj = (obj.start, obj.stop, obj.step)
+    elif is_object_array(obj):
+        obj = tuple(obj.ravel())
+    if isinstance(obj, (tuple, list, set)) and (max_length is None or len(obj) <= max_length):
+        # This is a fixed-size collection which is small enough
+        return tuple(obj)
+    return None
+
+
+@functools.lru_cache()
+def _get_leaf_types_not_of_type(object_type: Type) -> frozenset:
+    """
+    The leaf types that cannot be instances of `object_type`. When scanning for `object_type`, sub-objects of these
+    types are pruned before they are pushed for scanning.
+    """
+    return frozenset(leaf_type for leaf_type in LEAF_TYPES if not issubclass(leaf_type, object_type))
+
+
+def _should_scan_collection(max_depths_of_scanned_collections: dict, obj: Any, max_depth: Optional[int]) -> bool:
+    """
+    A collection referenced more than once (say, the same list passed as two arguments) is scanned again only if
+    reached with more remaining depth than before. Keyed by id, as the collections are kept alive by the scanned object.
+    """
+    scanned_max_depth = max_depths_of_scanned_collections.get(id(obj), 0)
+    if scanned_max_depth is None or max_depth is not None and scanned_max_depth >= max_depth:
+        return False
+    max_depths_of_scanned_collections[id(obj)] = max_depth
+    return True
+
+
+def _get_stack_for_args_kwargs(args: Args, kwargs: Kwargs,
+                               max_depth: Optional[int], max_length: Optional[int]) -> list:
+    """
+    The initial scanning stack for args and kwargs, scanned as the sub-objects of a single collection
+    (like `(*args, *kwargs.values())`), without building that collection.
+    """
+    if max_depth == 0 or max_length is not None and len(args) + len(kwargs) > max_length:
+        return []
+    next_max_depth = None if max_depth is None else max_depth - 1
+    stack = [(sub_obj, next_max_depth) for sub_obj in reversed(kwargs.values())]
+    stack.extend((sub_obj, next_max_depth) for sub_obj in reversed(args))
+    return stack
+
+
+def _iter_objects_matching_criteria_in_stack(func: Callable, stack: list, max_length: Optional[int],
+                                             prevent_repetitions: bool, types_to_prune: frozenset = frozenset()):
+    # The nesting is walked with an explicit stack rather than nested generators, so yielding an object does not
+    # pass through a generator per level. Sub-objects are pushed in reverse to keep the depth-first order.
+    # Repetitions are identified by id, which needs neither hashable objects nor their __hash__/__eq__
+    # (the objects are kept alive by the scanned object).
+    ids_of_objects = set()
+    max_depths_of_scanned_collections = {}
+    while stack:
+        current_obj, current_max_depth = stack.pop()
+        if func(current_obj):
+            if prevent_repetitions:
+                if id(current_obj) not in ids_of_objects:
+                    ids_of_objects.add(id(current_obj))
+                    yield current_obj
+            else:
+                yield current_obj
+
+        elif current_max_depth is None or current_max_depth > 0:
+            # Recurse into composite objects
+            sub_objects = _get_sub_objects_to_scan(current_obj, max_length)
+            # Collections referenced more than once can only be skipped if repeated matches are not yielded anyway
+            if sub_objects is not None and (not prevent_repetitions or _should_scan_collection(
+                    max_depths_of_scanned_collections, current_obj, current_max_depth)):
+                next_max_depth = None if current_max_depth is None else current_max_depth - 1
+                stack.extend((sub_obj, next_max_depth) for sub_obj in reversed(sub_objects)
+                             if type(sub_obj) not in types_to_prune)
+
+
 def iter_objects_matching_criteria_in_object_recursively(func: Callable, obj: Any,
                                                          max_depth: Optional[int] = None,
                                                          max_length: Optional[int] = None,
@@ -49,30 +136,35 @@ def iter_objects_matching_criteria_in_object_recursively(func: Callable, obj: An
     `max_depth=1` means `obj` and all objects it directly references, and so on.
     When `max_length` is given, does not recurse into iterables larger than `max_length`.
     """
-    objects = set()
-    if func(obj):
-        if prevent_repetitions:
-            if obj not in objects:
-                objects.add(obj)
-                yield obj
-        else:
-            yield obj
-
-    elif max_depth is None or max_depth > 0:
-        # Recurse into composite objects
-        if isinstance(obj, slice):
-            obj = (obj.start, obj.stop, obj.step)
-        if is_object_array(obj):
-            obj = tuple(obj.ravel())
-        if isinstance(obj, (tuple, list, set)):
-            # This is a fixed-size collection
-            if max_length is None or len(obj) <= max_length:
-                # The collection is small enough
-                next_max_depth = None if max_depth is None else max_depth - 1
-                for sub_obj in obj:
-                    yield from iter_objects_matching_criteria_in_object_recursively(func, sub_obj,
-                                                                                    next_max_depth, max_length,
-                                                                                    prevent_repetitions)
+    return _iter_objects_matching_criteria_in_stack(func, [(obj, max_depth)], max_length, prevent_repetitions)
+
+
+def _is_object_of_type_in_stack(object_type: Type, stack: list, max_length: Optional[int]) -> bool:
+    types_to_prune = _get_leaf_types_not_of_type(object_type)
+    max_depths_of_scanned_collections = {}
+    while stack:
+        current_obj, current_max_depth = stack.pop()
+        if isinstance(current_obj, object_type):
+            return True
+
+        if current_max_depth is None or current_max_depth > 0:
+            sub_objects = _get_sub_objects_to_scan(current_obj, max_length)
+            if sub_objects is not None \
+                    and _should_scan_collection(max_depths_of_scanned_collections, current_obj, current_max_depth):
+                next_max_depth = None if current_max_depth is None else current_max_depth - 1
+                stack.extend((sub_obj, next_max_depth) for sub_obj in sub_objects
+                             if type(sub_obj) not in types_to_prune)
+    return False
+
+
+def is_object_of_type_in_object_recursively(object_type: Type, obj,
+                                            max_depth: Optional[int] = None,
+                                            max_length: Optional[int] = None) -> bool:
+    """
+    Whether an object of the given type is nested in `obj` (scanning like `iter_objects_of_type_in_object_recursively`).
+    Returns upon the first object found.
+    """
+    return _is_object_of_type_in_stack(object_type, [(obj, max_depth)], max_length)
 
 
 def iter_objects_of_type_in_object_recursively(object_type: Type, obj,
@@ -81,7 +173,8 @@ def iter_objects_of_type_in_object_recursively(object_type: Type, obj,
     def is_type(sub_obj):
         return isinstance(sub_obj, object_type)
 
-    yield from iter_objects_matching_criteria_in_object_recursively(is_type, obj, max_depth, max_length)
+    return _iter_objects_matching_criteria_in_stack(is_type, [(obj, max_depth)], max_length, prevent_repetitions=True,
+                                                    types_to_prune=_get_leaf_types_not_of_type(object_type))
 
 
 def is_iterator_empty(iterator):
@@ -118,11 +211,42 @@ def iter_objects_of_type_in_object(object_type: Type, obj: Any, recursive: bool
     return result
 
 
+def is_object_of_type_in_object(object_type: Type, obj: Any, recursive: bool = False) -> bool:
+    """
+    Whether an object of the given type is nested in `obj`, scanning as `iter_objects_of_type_in_object` does.
+    """
+    if DEBUG:
+        # validate against the recursive scan
+        return not is_iterator_empty(iter_objects_of_type_in_object(object_type, obj, recursive))
+    if recursive:
+        return is_object_of_type_in_object_recursively(object_type, obj)
+    return is_object_of_type_in_object_recursively(object_type, obj, SHALLOW_MAX_DEPTH, SHALLOW_MAX_LENGTH)
+
+
 def iter_object_type_in_args_kwargs(object_type, args: Args, kwargs: Kwargs):
     """
     Returns an iterator for all objects of a type nested in the given args and kwargs.
     """
-    return iter_objects_of_type_in_object(object_type, (*args, *kwargs.values()))
+    if DEBUG:
+        return iter_objects_of_type_in_object(object_type, (*args, *kwargs.values()))
+
+    def is_type(sub_obj):
+        return isinstance(sub_obj, object_type)
+
+    return _iter_objects_matching_criteria_in_stack(
+        is_type, _get_stack_for_args_kwargs(args, kwargs, SHALLOW_MAX_DEPTH, SHALLOW_MAX_LENGTH),
+        SHALLOW_MAX_LENGTH, prevent_repetitions=True, types_to_prune=_get_leaf_types_not_of_type(object_type))
+
+
+def is_object_of_type_in_args_kwargs(object_type, args: Args, kwargs: Kwargs) -> bool:
+    """
+    Whether an object of the given type is nested in the given args and kwargs.
+    """
+    if DEBUG:
+        return is_object_of_type_in_object(object_type, (*args, *kwargs.values()))
+    return _is_object_of_type_in_stack(
+        object_type, _get_stack_for_args_kwargs(args, kwargs, SHALLOW_MAX_DEPTH, SHALLOW_MAX_LENGTH),
+        SHALLOW_MAX_LENGTH)
 
 
 ITERATE_ON_OBJECT_ARRAYS = False
@@ -135,7 +259,7 @@ def recursively_run_func_on_object(func: Callable, obj: Any,
                                    ):
     if with_path:
         path = path or []
-    if max_depth is None or max_depth > 0:
+    if (max_depth is None or max_depth > 0) and type(obj) not in LEAF_TYPES:
         # Recurse into composite objects
         next_max_depth = None if max_depth is None else max_depth - 1
 
@@ -184,6 +308,25 @@ def recursively_run_func_on_object(func: Callable, obj: Any,
     return func(path, obj) if with_path else func(obj)
 
 
+def create_false_like_object(obj: Any) -> Any:
+    """
+    Return an object with the nested structure of `obj`, with all items replaced by False.
+    Same as `recursively_run_func_on_object(lambda x: False, obj)`, without calling a function per item.
+    """
+    if isinstance(obj, (tuple, list, set)):
+        return type(obj)(create_false_like_object(sub_obj) for sub_obj in obj)
+    if isinstance(obj, dict):
+        return type(obj)({key: create_false_like_object(sub_obj) for key, sub_obj in obj.items()})
+    if isinstance(obj, slice):
+        return slice(False, False, False)
+    if ITERATE_ON_OBJECT_ARRAYS and is_object_array(obj):
+        new_array = np_full(obj.shape, None, dtype=object)
+        for indices, value in np.ndenumerate(obj):
+            new_array[indices] = create_false_like_object(value)
+        return new_array
+    return False
+
+
 def get_paths_for_objects_of_type(obj: Any, type_: Type) -> Paths:
     """
     Get paths for all objects of a certain `type_` within an `obj`
@@ -1,7 +1,8 @@
+import functools
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import List, Any, Optional, Type
+from typing import List, Any, Optional, Type, Tuple
 
 from pyquibbler.env import SAFE_MODE
 from pyquibbler.exceptions import PyQuibblerException
@@ -84,6 +85,13 @@ class ConditionalRunner(ABC):
         raise RunnerFailedException(message)
 
 
+@functools.lru_cache()
+def get_runner_types_matching_run_condition(runner_types: Tuple[Type[ConditionalRunner], ...],
+                                            run_condition: Optional[RunCondition]) \
+        -> Tuple[Type[ConditionalRunner], ...]:
+    return tuple(runner_type for runner_type in runner_types if runner_type.is_matching_run_condition(run_condition))
+
+
 # multiple instance runner:
 
 class MultipleInstanceRunner:
@@ -122,18 +130,17 @@ class MultipleInstanceRunner:
         """
         Call all the matching runners until one of them succeeds.
         """
-        for runner_type in self._runner_types:
-            if runner_type.is_matching_run_condition(self._run_condition):
-                runner = runner_type(*self._args, **self._kwargs)
-                if runner.can_try():
-                    try:
-                        return runner.try_run()
-                    except BaseRunnerFailedException:
+        for runner_type in get_runner_types_matching_run_condition(tuple(self._runner_types), self._run_condition):
+            runner = runner_type(*self._args, **self._kwargs)
+            if runner.can_try():
+                try:
+                    return runner.try_run()
+                except BaseRunnerFailedException:
+                    pass
+                except Exception as e:
+                    if SAFE_MODE:
                         pass
-                    except Exception as e:
-                        if SAFE_MODE:
-                            pass
-                        else:
-                            raise e
+                    else:
+                        raise e
 
         raise NoRunnerWorkedException()
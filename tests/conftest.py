@@ -147,7 +147,6 @@ def set_backend():
 
 @fixture
 def axes():
-    from matplotlib import pyplot as plt
     plt.close("all")
     plt.gcf().set_size_inches(8, 6)
     return plt.gca()
@@ -1,4 +1,5 @@
 import numpy as np
+from collections import deque
 from typing import List, Tuple, Union
 from unittest.mock import Mock
 from pytest import raises, fixture, mark
@@ -27,14 +28,14 @@ def get_overrides_for_assignment(quib, assignment: Assignment):
 
 class ChooseOverrideDialogMockSideEffect:
     def __init__(self):
-        self.choices = []
+        self.choices = deque()
 
     def add_choices(self, *choices: Tuple[Union[OverrideChoice, Exception], List[AssignmentToQuib], bool]):
-        self.choices = [*self.choices, *choices]
+        self.choices.extend(choices)
 
     def __call__(self, options: List[AssignmentToQuib], can_diverge: bool):
         assert self.choices, 'The dialog mock was called more times than expected'
-        (choice, expected_options, excpected_can_diverge) = self.choices.pop(0)
+        (choice, expected_options, excpected_can_diverge) = self.choices.popleft()
         assert expected_options == options
         assert excpected_can_diverge == can_diverge
         assert options, 'There is no reason to open a dialog without options'
@@ -49,7 +50,7 @@ class ChooseOverrideDialogMockSideEffect:
         return choice
 
     def assert_all_choices_made(self):
-        assert not self.choices, f'Not all choices were made, left with: {self.choices}'
+        assert not self.choices, f'Not all choices were made, left with: {list(self.choices)}'
 
 
 @fixture
@@ -68,8 +69,8 @@ def assignment_to_multiple():
 
 
 @fixture(autouse=True)
-def clear_choice_cache():
-    OverrideOptionsTree._CHOICE_CACHE.clear()
+def clear_choice_cache(monkeypatch):
+    monkeypatch.setattr(OverrideOptionsTree, '_CHOICE_CACHE', {})
 
 
 @fixture
@@ -5,6 +5,7 @@ from pytest import fixture
 from pyquibbler.assignment import Overrider, Assignment
 from pyquibbler.path.path_component import PathComponent
 from pyquibbler.path.data_accessing import FailedToDeepAssignException
+from tests.functional.utils import OLD_FORMAT_BINARY_ASSIGNMENTS
 
 
 @fixture
@@ -136,3 +137,23 @@ def test_overrider_loads_multiple_assignments_from_text():
     assert overrider[0] == Assignment(value=10, path=[PathComponent(1)])
     assert overrider[1] == Assignment(value=20, path=[PathComponent(2)])
 
+
+def test_overrider_loads_binary_file_saved_by_older_version(overrider, tmp_path):
+    file = tmp_path / 'overrides.quib'
+    file.write_bytes(OLD_FORMAT_BINARY_ASSIGNMENTS)
+
+    overrider.load_from_binary(file)
+
+    assert overrider.get_assignments() == [Assignment(value=5, path=[PathComponent(1)])]
+    assert overrider.override([0, 0]) == [0, 5]
+
+
+def test_overrider_save_and_load_binary(overrider, tmp_path):
+    file = tmp_path / 'overrides.quib'
+    overrider.add_assignment(Assignment(value=5, path=[PathComponent(1)]))
+    overrider.save_as_binary(file)
+
+    loaded_overrider = Overrider()
+    loaded_overrider.load_from_binary(file)
+
+    assert loaded_overrider.get_assignments() == [Assignment(value=5, path=[PathComponent(1)])]
@@ -16,10 +16,11 @@ def inverse(func: Callable, indices: Any, value: Any, args: Tuple[Any, ...] = No
 
     args = args or tuple()
     kwargs = kwargs or {}
-    previous_value = SourceFuncCall.from_(func, args, kwargs).run()
+    func_call = SourceFuncCall.from_(func, args, kwargs)
+    previous_value = func_call.run()
     assignment = assignment or Assignment(path=[PathComponent(indices)] if not empty_path else [], value=value)
     inversals = invert(
-        func_call=SourceFuncCall.from_(func, args, kwargs),
+        func_call=func_call,
         previous_result=previous_value,
         assignment=assignment
     )
@@ -56,6 +56,16 @@ def test_redraw_in_aggregate_mode():
     assert mock_func.call_count == 2
 
 
+def test_aggregate_mode_without_graphics_quibs_does_not_redraw(figure):
+    quib = iquib(1)
+    _ = quib + 1
+
+    with mock.patch('pyquibbler.quib.graphics.redraw.redraw_figures') as redraw_figures_mock:
+        quib.handler.invalidate_and_aggregate_redraw_at_path([])
+
+    redraw_figures_mock.assert_not_called()
+
+
 def tests_artists_are_garbage_collected_upon_redraw(axes, get_live_artists):
     xy = iquib([0.6, 0.4])
     print(len(get_live_artists()))
@@ -10,6 +10,7 @@ from pyquibbler.env import GET_VARIABLE_NAMES
 from pyquibbler.quib.specialized_functions.iquib import iquib, CannotNestQuibInIQuibException
 from pyquibbler.file_syncing.types import SaveFormat
 from pyquibbler.quib.quib import Quib
+from tests.functional.utils import OLD_FORMAT_BINARY_ASSIGNMENTS
 
 
 def test_iquib_get_value_returns_argument():
@@ -70,6 +71,16 @@ def test_iquib_save_and_load(save_format: SaveFormat):
     assert a.get_value() == b.get_value()
 
 
+def test_iquib_loads_binary_file_saved_by_older_version():
+    a = iquib([0, 0]).setp(save_format=SaveFormat.BIN, name='old_quib')
+    pathlib.Path(a.file_path).parent.mkdir(parents=True, exist_ok=True)
+    pathlib.Path(a.file_path).write_bytes(OLD_FORMAT_BINARY_ASSIGNMENTS)
+
+    a.load()
+
+    assert a.get_value() == [0, 5]
+
+
 @pytest.mark.get_variable_names(True)
 def test_iquib_loads_if_same_name():
     save_name = "example_quib"
@@ -13,8 +13,10 @@ from pyquibbler.quib.factory import create_quib
 @pytest.fixture
 def create_quib_with_return_value():
     def _create(ret_val, allow_overriding=False, lazy=True):
-        return create_quib(mock.Mock(return_value=ret_val), allow_overriding=allow_overriding,
-                           lazy=lazy)
+        # a plain function rather than a Mock, as the calls are not asserted on and Mock calls are slow to record
+        def func():
+            return ret_val
+        return create_quib(func, allow_overriding=allow_overriding, lazy=lazy)
     return _create
 
 
@@ -30,7 +32,8 @@ def quib():
 
 @pytest.fixture()
 def graphics_quib(quib) -> Quib:
-    func = mock.Mock()
+    # spec to a plain callable, so that attribute probing by pyquibbler does not create child mocks:
+    func = mock.Mock(spec=['__call__'])
     add_definition_for_function(func=func, func_definition=create_or_reuse_func_definition(is_graphics=True))
     return create_quib(
         func=func,
@@ -41,7 +44,6 @@ def graphics_quib(quib) -> Quib:
 
 @pytest.fixture
 def figure() -> plt.Figure:
-    from matplotlib import pyplot as plt
     plt.close("all")
     fig = plt.gcf()
     fig.set_size_inches(8, 6)
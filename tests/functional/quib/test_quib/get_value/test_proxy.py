@@ -1,14 +1,15 @@
+from pyquibbler import iquib
 from pyquibbler.path.path_component import PathComponent
 from pyquibbler.quib.specialized_functions.proxy import create_proxy
-from tests.functional.quib.test_quib.get_value.utils import collecting_quib
+from tests.functional.quib.test_quib.get_value.utils import collect_valid_paths
 
 
 def test_proxy_get_value():
     val = [1, 2, 3]
-    path_collector_quib = collecting_quib(val)
+    path_collector_quib = iquib(val)
     proxy = create_proxy(path_collector_quib)
 
-    with path_collector_quib.collect_valid_paths() as valid_paths:
+    with collect_valid_paths(path_collector_quib) as valid_paths:
         res = proxy.get_value_valid_at_path([PathComponent(0)])
 
     assert valid_paths == [[PathComponent(0)]]
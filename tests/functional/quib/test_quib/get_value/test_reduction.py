@@ -1,30 +1,30 @@
 import numpy as np
 import pytest
 
-from pyquibbler import CacheMode
+from pyquibbler import CacheMode, iquib
 from pyquibbler.path import PathComponent
 from pyquibbler.utilities.iterators import recursively_compare_objects
 from tests.functional.quib.test_quib.get_value.test_apply_along_axis import parametrize_keepdims, \
     parametrize_where, parametrize_data
-from tests.functional.quib.test_quib.get_value.utils import collecting_quib, check_get_value_valid_at_path
+from tests.functional.quib.test_quib.get_value.utils import collect_valid_paths, check_get_value_valid_at_path
 
 
 def test_reduction_function_gets_whole_value_of_non_data_source_parents():
     # This is also a regression to handling 0 data source quibs
-    non_data = collecting_quib(0)
+    non_data = iquib(0)
     fquib = np.sum([1, 2, 3], axis=non_data)
     fquib.cache_mode = CacheMode.OFF
-    with non_data.collect_valid_paths() as valid_paths:
+    with collect_valid_paths(non_data) as valid_paths:
         fquib.get_value()
 
     assert valid_paths == [[]]
 
 
 def test_reduction_function_gets_whole_value_of_data_source_parents_when_whole_value_changed():
-    data = collecting_quib([1, 2, 3])
+    data = iquib([1, 2, 3])
     fquib = np.sum(data)
     fquib.cache_mode = CacheMode.OFF
-    with data.collect_valid_paths() as valid_paths:
+    with collect_valid_paths(data) as valid_paths:
         fquib.get_value()
 
     assert recursively_compare_objects(valid_paths, [[PathComponent(np.array([True,  True,  True]))]])
@@ -55,10 +55,10 @@ def test_reduction_axiswise_get_value_valid_at_path(axis, data, keepdims, where,
 
 @pytest.mark.regression
 def test_quib_get_value_valid_at_path_with_data_source_kwarg():
-    parent = collecting_quib([[1]])
+    parent = iquib([[1]])
     quib = np.sum(a=parent, axis=1)
     quib.cache_mode = CacheMode.OFF
-    with parent.collect_valid_paths() as paths:
+    with collect_valid_paths(parent) as paths:
         quib.get_value_valid_at_path([PathComponent(0)])
 
     assert len(paths) == 1
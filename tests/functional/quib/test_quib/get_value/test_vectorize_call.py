@@ -12,7 +12,7 @@ from pyquibbler.path.path_component import PathComponent
 from pyquibbler.assignment import get_override_group_for_quib_change
 from tests.functional.utils import PathBuilder, get_func_mock
 from tests.functional.quib.test_quib.get_value.test_apply_along_axis import parametrize_data
-from tests.functional.quib.test_quib.get_value.utils import check_get_value_valid_at_path, collecting_quib
+from tests.functional.quib.test_quib.get_value.utils import check_get_value_valid_at_path, collect_valid_paths
 
 
 @parametrize_data
@@ -25,7 +25,7 @@ def test_vectorize_get_value_valid_at_path(data, func, indices_to_get_value_at):
 
 @pytest.mark.parametrize('pass_quibs', [True])
 def test_vectorize_get_value_valid_at_path_with_excluded_quib(pass_quibs):
-    excluded = collecting_quib(np.array([1, 2, 3]))
+    excluded = iquib(np.array([1, 2, 3]))
 
     @functools.partial(np.vectorize, excluded={1}, signature='(n)->(m)', pass_quibs=pass_quibs)
     def func(_a, b):
@@ -37,7 +37,7 @@ def test_vectorize_get_value_valid_at_path_with_excluded_quib(pass_quibs):
     fquib.cache_mode = CacheMode.OFF
     path = PathBuilder(fquib)[0].path
 
-    with excluded.collect_valid_paths() as valid_paths:
+    with collect_valid_paths(excluded) as valid_paths:
         fquib.get_value_valid_at_path(path)
 
     assert valid_paths == [[]]
@@ -1,37 +1,34 @@
-import functools
-
 import numpy as np
 from contextlib import contextmanager
 from copy import deepcopy
 from typing import Any
 
 from pyquibbler import CacheMode, Assignment, iquib
+from pyquibbler.quib.quib import Quib
 from pyquibbler.path.path_component import PathComponent, Path
 from pyquibbler.path.data_accessing import deep_get, deep_set
 from tests.functional.utils import PathBuilder
 
 
-def collecting_quib(data):
-    quib = iquib(data)
-
-    def collect_and_get_value_valid_at_path(previous_func, self, path, *args, **kwargs):
-        if path is not None:
-            self._valid_paths.append(path)
-        return previous_func(path)
-
-    @contextmanager
-    def collect_valid_paths(self):
-        self._valid_paths.clear()
-        yield self._valid_paths
-        self._valid_paths = []
+@contextmanager
+def collect_valid_paths(quib: Quib):
+    """
+    Collect the paths at which the value of the given quib is requested.
+    Quib uses __slots__, so we patch the class method and filter by the requested quib.
+    """
+    valid_paths = []
+    previous_get_value_valid_at_path = Quib.get_value_valid_at_path
 
-    quib._valid_paths = []
-    quib.get_value_valid_at_path = functools.partial(collect_and_get_value_valid_at_path,
-                                                     quib.get_value_valid_at_path,
-                                                     quib)
-    quib.collect_valid_paths = functools.partial(collect_valid_paths, quib)
+    def collect_and_get_value_valid_at_path(self, path, *args, **kwargs):
+        if self is quib and path is not None:
+            valid_paths.append(path)
+        return previous_get_value_valid_at_path(self, path, *args, **kwargs)
 
-    return quib
+    Quib.get_value_valid_at_path = collect_and_get_value_valid_at_path
+    try:
+        yield valid_paths
+    finally:
+        Quib.get_value_valid_at_path = previous_get_value_valid_at_path
 
 
 def get_indices_at_path(shape, path):
@@ -94,13 +91,13 @@ def check_get_value_valid_at_path(func, data, path_to_get_value_at):
     1. No other changed path in the input data can change the path in the result
     2. Any change in the requested input data will change the path in the result
     """
-    input_quib = collecting_quib(data)
+    input_quib = iquib(data)
     result_quib = func(input_quib)
     result_quib.cache_mode = CacheMode.OFF
 
     result = result_quib.get_value()
 
-    with input_quib.collect_valid_paths() as requested_paths:
+    with collect_valid_paths(input_quib) as requested_paths:
         result_quib.get_value_valid_at_path(path_to_get_value_at)
 
     # Check that every index in the data requested from the parent actually affects the result
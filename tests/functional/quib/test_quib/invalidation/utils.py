@@ -1,17 +1,22 @@
 import numpy as np
 from operator import or_
-from functools import reduce
-from typing import Set
+from functools import reduce, lru_cache
+from typing import Set, Tuple
 
 from pyquibbler import iquib, CacheMode
 from pyquibbler.quib.quib import Quib
 from pyquibbler.cache.cache import CacheStatus
 
 
+@lru_cache(maxsize=64)
+def get_indices_for_shape(shape: Tuple[int, ...]) -> Tuple[Tuple[int, ...], ...]:
+    return tuple(np.ndindex(shape))
+
+
 def breakdown_quib(quib: Quib) -> Set[Quib]:
     quib_type = quib.get_type()
     if issubclass(quib_type, np.ndarray):
-        return {quib[idx] for idx in np.ndindex(quib.get_shape())}
+        return {quib[idx] for idx in get_indices_for_shape(tuple(quib.get_shape()))}
     if issubclass(quib_type, (np.generic, int)):
         return set()
     if issubclass(quib_type, (tuple, list)):
@@ -23,6 +28,15 @@ def get_indices_from_getitem_quibs(getitem_quibs):
     return sorted(c.args[1] if len(c.args[1]) != 1 else c.args[1][0] for c in getitem_quibs)
 
 
+def get_value_of_sub_quib_from_value(sub_quib: Quib, quib: Quib, value):
+    """
+    Get the value of a sub quib (a getitem quib of `quib`, possibly nested), given the value of `quib`.
+    """
+    if sub_quib is quib:
+        return value
+    return get_value_of_sub_quib_from_value(sub_quib.args[0], quib, value)[sub_quib.args[1]]
+
+
 def check_invalidation(func, data, indices_to_invalidate):
     """
     Run func on an ndarray iquib, change the iquib in the given indices,
@@ -35,12 +49,17 @@ def check_invalidation(func, data, indices_to_invalidate):
     result.cache_mode = CacheMode.OFF
     children = breakdown_quib(result)
 
+    # getting the value of each child also makes its cache valid, so that invalidation can be detected:
     original_values = {child: child.get_value() for child in children}
 
     input_quib.assign(999, *indices_to_invalidate)
 
     invalidated_children = {child for child in children if child.cache_status == CacheStatus.ALL_INVALID}
-    changed_children = {child for child in children if not np.array_equal(child.get_value(), original_values[child])}
+    # the new values of the children are taken from a single evaluation of the result:
+    new_value = result.get_value()
+    changed_children = {child for child in children
+                        if not np.array_equal(get_value_of_sub_quib_from_value(child, result, new_value),
+                                              original_values[child])}
     assert invalidated_children == changed_children, \
         f'\nInvalidated: {get_indices_from_getitem_quibs(invalidated_children)}' \
         f'\nExpected:    {get_indices_from_getitem_quibs(changed_children)}'
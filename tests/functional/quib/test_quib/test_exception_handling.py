@@ -40,6 +40,22 @@ def test_get_shape_of_q_function_raises_external_call_exception():
     assert r.value.quibs_with_calls == [(b, 'get_shape()')]
 
 
+@pytest.mark.parametrize('method_name', ['get_type', 'get_shape', 'get_ndim'])
+@pytest.mark.show_quib_exceptions_as_quib_traceback(True)
+def test_failed_quib_call_is_reported_under_public_method_name(method_name):
+
+    def divide_by_zero(x):
+        return x / 0
+
+    a = iquib(1)
+    b = q(divide_by_zero, a)
+
+    with pytest.raises(ExternalCallFailedException, match='.*') as r:
+        getattr(b, method_name)()
+
+    assert r.value.quibs_with_calls == [(b, f'{method_name}()')]
+
+
 @pytest.mark.show_quib_exceptions_as_quib_traceback(True)
 def test_exception_during_quib_creation():
     import numpy as np
@@ -1,4 +1,5 @@
 import os
+from unittest import mock
 
 import pytest
 import numpy as np
@@ -79,3 +80,22 @@ def test_quib_get_value_with_autoload(project):
     result = a.get_value()  # Should autoload at this point
 
     assert result == [2, 2, 3]
+
+
+def test_setp_notifies_file_name_change_once():
+    a = iquib(np.array([1., 2., 3.]))
+    with mock.patch.object(type(a.handler.file_syncer), 'on_file_name_changed') as on_file_name_changed:
+        a.setp(assigned_name='a', save_format='txt', save_directory='dir')
+
+    on_file_name_changed.assert_called_once()
+
+
+def test_file_path_is_reused_until_name_changes(project):
+    a = iquib(np.array([1., 2., 3.]), assigned_name='a', save_format='txt')
+    file_path = a.file_path
+
+    assert a.file_path is file_path
+
+    a.assigned_name = 'b'
+
+    assert a.file_path == project.directory / 'b.txt'
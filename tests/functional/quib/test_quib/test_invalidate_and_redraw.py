@@ -76,3 +76,16 @@ def test_quib_invalidates_all_when_invalidated_at_param_source(quib, create_quib
 
     assert quib_with_param_source.cache_status == CacheStatus.ALL_INVALID
 
+
+def test_invalidation_of_deep_quib_chain_does_not_recurse():
+    top = create_quib(func=mock.Mock(return_value=0))
+    bottom = top
+    for _ in range(1500):
+        bottom = create_quib(func=mock.Mock(return_value=0), args=(bottom,))
+        # warm each cache as we go, so that getting the value never needs to recurse up the chain:
+        bottom.get_value()
+    assert bottom.cache_status == CacheStatus.ALL_VALID, "sanity"
+
+    top.handler.invalidate_and_aggregate_redraw_at_path([])
+
+    assert bottom.cache_status == CacheStatus.ALL_INVALID
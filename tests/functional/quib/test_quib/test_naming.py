@@ -1,9 +1,12 @@
+import os
+import sysconfig
 from unittest import mock
 
 import pytest
 
 from pyquibbler.utilities.input_validation_utils import InvalidArgumentTypeException, InvalidArgumentValueException
 from pyquibbler.quib.factory import create_quib
+from pyquibbler.quib.variable_metadata import get_frame_outside_of_pyquibbler
 
 
 @pytest.mark.get_variable_names(True)
@@ -49,6 +52,57 @@ def test_quib_with_multiple_in_same_line():
     assert b.name == 'b'
 
 
+@pytest.mark.get_variable_names(True)
+def test_quib_var_name_when_created_repeatedly_in_same_line():
+    names = []
+    for value in range(3):
+        quib_in_loop = create_quib(func=mock.Mock(return_value=value))
+        names.append(quib_in_loop.name)
+
+    assert names == ['quib_in_loop'] * 3
+
+
+@pytest.mark.get_variable_names(True)
+def test_quib_with_multiple_in_same_line_created_repeatedly():
+    for _ in range(2):
+        a, b = create_quib(func=mock.Mock(return_value=1)), create_quib(func=mock.Mock(return_value=2))
+
+        assert a.name == 'a'
+        assert b.name == 'b'
+
+
+@pytest.mark.get_variable_names(False)
+@pytest.mark.show_quib_exceptions_as_quib_traceback(False)
+def test_create_quib_does_not_look_up_user_frame_when_not_needed():
+    with mock.patch('pyquibbler.quib.factory.get_frame_outside_of_pyquibbler') as get_frame_outside_of_pyquibbler:
+        create_quib(func=mock.Mock())
+
+    get_frame_outside_of_pyquibbler.assert_not_called()
+
+
+@pytest.mark.get_variable_names(True)
+@pytest.mark.show_quib_exceptions_as_quib_traceback(True)
+def test_create_quib_looks_up_user_frame_once():
+    with mock.patch('pyquibbler.quib.factory.get_frame_outside_of_pyquibbler',
+                    wraps=get_frame_outside_of_pyquibbler) as get_frame:
+        created_quib = create_quib(func=mock.Mock())
+
+    get_frame.assert_called_once()
+    assert created_quib.name == 'created_quib'
+    assert created_quib.created_in.line_no > 0
+
+
+@pytest.mark.get_variable_names(True)
+def test_quib_var_name_when_created_through_the_standard_library():
+    namespace = {'create_quib': create_quib, 'mock': mock}
+    stdlib_file_name = os.path.join(sysconfig.get_path('stdlib'), 'module_creating_quibs.py')
+    exec(compile('def create():\n    return create_quib(func=mock.Mock())\n', stdlib_file_name, 'exec'), namespace)
+
+    quib_through_stdlib = namespace['create']()
+
+    assert quib_through_stdlib.name == 'quib_through_stdlib'
+
+
 @pytest.mark.get_variable_names(True)
 def test_quib_doesnt_get_name_if_it_is_created_in_context():
     def func():
@@ -122,3 +122,14 @@ def test_len_bool_etc_of_quib_allowed(create_quib_with_return_value, func, value
     quib = create_quib_with_return_value(value)
     with LEN_BOOL_ETC_RAISE_EXCEPTION.temporary_set(False):
         assert func(quib) == expected_value
+
+
+def test_quib_hash_and_eq_are_identity_based(create_quib_with_return_value):
+    quib = create_quib_with_return_value(np.array([1, 2]))
+    same_value_quib = create_quib_with_return_value(np.array([1, 2]))
+
+    assert hash(quib) == object.__hash__(quib)
+    assert quib == quib
+    assert not (quib == same_value_quib)
+    assert len({quib, same_value_quib}) == 2
+    assert isinstance(quib != same_value_quib, Quib)
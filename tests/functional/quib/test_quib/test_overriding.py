@@ -118,6 +118,20 @@ def test_quib_get_override_mask_whole_array_override():
     assert np.array_equal(quib.get_override_mask().get_value(), [True, True, True])
 
 
+def test_quib_get_override_mask_after_whole_array_default_assignment():
+    quib = create_quib(func=mock.Mock(return_value=np.array([0, 1, 2])), allow_overriding=True)
+    quib[0] = 10
+    quib.assign(default)
+    quib[2] = 12
+    assert np.array_equal(quib.get_override_mask().get_value(), [False, False, True])
+
+
+def test_quib_get_override_mask_without_overrides_does_not_create_overrider():
+    quib = create_quib(func=mock.Mock(return_value=np.array([0, 1])), allow_overriding=True)
+    assert np.array_equal(quib.get_override_mask().get_value(), [False, False])
+    assert not quib.handler.has_overrider
+
+
 @pytest.mark.regression
 def test_quib_get_override_mask_with_list():
     quib = create_quib(func=mock.Mock(return_value=[10, [21, 22], 30]), allow_overriding=True)
@@ -173,6 +187,16 @@ def test_full_overriding_prevents_get_value():
     assert a3.get_value() == 14
 
 
+def test_array_quib_overridden_then_partially_reset_gets_source_values():
+    a = create_quib(mock.Mock(return_value=np.array([1, 2, 3])), allow_overriding=True)
+    a.assign(np.array([11, 12, 13]))
+    a.assign(20, 0)
+    a.assign(default, 1)
+    b = a + 0
+
+    assert np.array_equal(b.get_value(), [20, 2, 13])
+
+
 @pytest.mark.regression
 def test_quib_get_value_when_fully_overridden():
     quib = create_quib(mock.Mock(return_value=[1, 2, 3]), allow_overriding=True, cache_mode=CacheMode.OFF)
@@ -42,6 +42,28 @@ def test_descendants():
     assert me.get_descendants(depth=2, bypass_intermediate_quibs=True) == {child, great_grand_child}
 
 
+def test_ancestors_and_descendants_of_diamond():
+    top = create_quib(func=mock.Mock())
+    left = create_quib(func=mock.Mock(), args=(top,))
+    right = create_quib(func=mock.Mock(), args=(top,))
+    bottom = create_quib(func=mock.Mock(), args=(left, right))
+
+    assert sorted(map(id, bottom.handler.iter_ancestors())) == sorted(map(id, [top, left, right]))
+    assert sorted(map(id, top.handler.iter_descendants())) == sorted(map(id, [left, right, bottom]))
+    assert bottom.get_ancestors() == {top, left, right}
+    assert top.get_descendants() == {left, right, bottom}
+
+
+def test_ancestors_reuse_known_ancestors_of_parents():
+    grand_parent = create_quib(func=mock.Mock())
+    parent = create_quib(func=mock.Mock(), args=(grand_parent,))
+    me = create_quib(func=mock.Mock(), args=(parent,))
+
+    assert parent.handler.ancestors == {grand_parent}
+    assert me.handler.ancestors == {grand_parent, parent}
+    assert me.handler.ancestors is me.handler.ancestors
+
+
 def test_named_parents():
     grandma = create_quib(func=mock.Mock(), assigned_name='grandma')
     mom = create_quib(func=mock.Mock(), args=(grandma,), assigned_name='mom')
@@ -70,3 +92,15 @@ def test_named_children():
     grand_daughter = create_quib(func=mock.Mock(), args=(daughter,), assigned_name='grandpa')
 
     assert me.get_children(True) == {daughter, grand_son}
+
+
+def test_descendants_with_depth_of_diamond():
+    top = create_quib(func=mock.Mock())
+    left = create_quib(func=mock.Mock(), args=(top,))
+    right = create_quib(func=mock.Mock(), args=(top,))
+    bottom = create_quib(func=mock.Mock(), args=(left, right), assigned_name='bottom')
+
+    assert top.get_descendants(depth=1) == {left, right}
+    assert top.get_descendants(depth=2) == {left, right, bottom}
+    assert top.get_descendants(bypass_intermediate_quibs=True) == {bottom}
+    assert bottom.get_ancestors(depth=1) == {left, right}
@@ -3,7 +3,9 @@ import unittest
 import numpy as np
 import pytest
 from pyquibbler.utilities.iterators import recursively_cast_one_object_by_other, recursively_compare_objects, \
-    CannotCastObjectByOtherObjectException
+    CannotCastObjectByOtherObjectException, create_false_like_object, recursively_run_func_on_object, \
+    iter_objects_of_type_in_object_recursively, is_object_of_type_in_object_recursively, \
+    iter_objects_matching_criteria_in_object_recursively
 
 
 @pytest.mark.parametrize(['template', 'obj', 'expected'], [
@@ -35,3 +37,65 @@ def test_recursively_compare_objects_type():
     assert recursively_compare_objects(obj1, obj2, type_only=True)
     assert not recursively_compare_objects(obj1, obj2, type_only=False)
 
+
+@pytest.mark.parametrize('obj', [
+    5,
+    [1, (2, 3), {'a': [4, 5], 'b': 'abc'}],
+    (slice(1, 3), {7, 8}),
+    np.array([1, 2, 3]),
+])
+def test_create_false_like_object(obj):
+    expected = recursively_run_func_on_object(lambda x: False, obj)
+
+    assert recursively_compare_objects(create_false_like_object(obj), expected)
+
+
+SHARED_LIST = [1, [2]]
+
+
+@pytest.mark.parametrize(['obj', 'max_depth', 'max_length', 'expected'], [
+    ([1, (2, [3]), 'a', slice(4, None)], None, None, [1, 2, 3, 4]),
+    ([1, (2, [3]), 'a', slice(4, None)], 1, None, [1]),
+    ([1, (2, [3]), 'a', slice(4, None)], 2, None, [1, 2, 4]),
+    ([1, (2, 3, 5), 4], None, 2, []),
+    ([1, (2, 1), [2, 3]], None, None, [1, 2, 3]),
+    ((SHARED_LIST, [SHARED_LIST]), None, None, [1, 2]),
+    (([SHARED_LIST], SHARED_LIST), 3, None, [1, 2]),
+])
+def test_iter_objects_of_type_in_object_recursively(obj, max_depth, max_length, expected):
+    assert list(iter_objects_of_type_in_object_recursively(int, obj, max_depth, max_length)) == expected
+    assert is_object_of_type_in_object_recursively(int, obj, max_depth, max_length) is bool(expected)
+
+
+def test_iter_objects_of_type_in_object_recursively_repeats_by_identity():
+    array = np.array([1, 2])
+    other_array = np.array([1, 2])
+    assert [id(o) for o in iter_objects_of_type_in_object_recursively(np.ndarray, [array, (array, other_array)])] \
+        == [id(array), id(other_array)]
+
+
+def test_iter_objects_matching_criteria_in_object_recursively_without_preventing_repetitions():
+    obj = (SHARED_LIST, [SHARED_LIST], 1)
+    assert list(iter_objects_matching_criteria_in_object_recursively(
+        lambda o: isinstance(o, int), obj, prevent_repetitions=False)) == [1, 2, 1, 2, 1]
+
+
+def test_iter_objects_of_type_in_object_recursively_finds_leaf_subclasses():
+    obj = ['a', (np.float64(1.5), True)]
+    assert list(iter_objects_of_type_in_object_recursively(float, obj)) == [np.float64(1.5)]
+    assert list(iter_objects_of_type_in_object_recursively(int, obj)) == [True]
+    assert is_object_of_type_in_object_recursively(float, obj) is True
+
+
+def test_iter_objects_of_type_in_deeply_nested_object():
+    obj = 7
+    for _ in range(5000):
+        obj = [obj]
+    assert list(iter_objects_of_type_in_object_recursively(int, obj)) == [7]
+
+
+def test_is_object_of_type_in_self_referencing_object():
+    obj = ['a']
+    obj.append(obj)
+    assert is_object_of_type_in_object_recursively(int, obj) is False
+    assert list(iter_objects_of_type_in_object_recursively(int, obj)) == []
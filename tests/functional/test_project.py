@@ -1,3 +1,4 @@
+import os
 import weakref
 from unittest import mock
 
@@ -12,6 +13,7 @@ from pyquibbler.project import Project, NothingToUndoException, NothingToRedoExc
 from pyquibbler.project.exceptions import NoProjectDirectoryException
 from pyquibbler.quib.factory import create_quib
 from pyquibbler.quib.graphics import GraphicsUpdateType, aggregate_redraw_mode
+from pyquibbler.quib.graphics.redraw import start_dragging, end_dragging
 from pyquibbler.utilities.file_path import PathWithHyperLink
 from pyquibbler.utilities.input_validation_utils import InvalidArgumentTypeException, UnknownEnumException
 
@@ -235,6 +237,24 @@ def test_project_undo_with_group_reverts_back_to_before_group_and_runs_graphics_
     assert mock_func.call_count == count + 1
 
 
+def test_undo_drag_reverts_all_drag_assignments_at_once(project):
+    a = iquib(5)
+    b = a + 10
+    start_dragging()
+    try:
+        for value in range(16, 26):
+            b.assign(value)
+    finally:
+        end_dragging()
+    assert a.get_value() == 15
+    assert [len(group) for group in project._undo_action_groups] == [1]
+
+    project.undo()
+
+    assert a.get_value() == 5
+    assert not project.can_undo()
+
+
 def test_project_has_undo_when_not():
     assert qb.can_undo() is False
 
@@ -357,3 +377,17 @@ def test_set_project_directory_affects_quib_directory(project):
     assert(str(quib.actual_save_directory).endswith('test'))
     project.directory = None
     assert quib.actual_save_directory is None
+
+
+def test_quib_actual_save_directory_follows_project_and_quib_directories(project):
+    quib = iquib(1)
+    assert quib.actual_save_directory is quib.actual_save_directory
+
+    quib.save_directory = 'sub_folder'
+    assert quib.actual_save_directory == project.directory / 'sub_folder'
+
+    project.directory = 'test'
+    assert str(quib.actual_save_directory).endswith(os.path.join('test', 'sub_folder'))
+
+    quib.save_directory = None
+    assert quib.actual_save_directory == project.directory
@@ -102,11 +102,40 @@ def test_iter_quibs_in_args(args, kwargs, quibs):
     assert set(iter_quibs_in_args(args, kwargs)) == quibs
 
 
+@mark.debug(False)
+@args_kwargs_quibs_test
+def test_iter_quibs_in_args_without_debug(args, kwargs, quibs):
+    assert set(iter_quibs_in_args(args, kwargs)) == quibs
+
+
 @args_kwargs_quibs_test
 def test_is_there_a_quib_in_args(args, kwargs, quibs):
     assert is_there_a_quib_in_args(args, kwargs) == (len(quibs) > 0)
 
 
+@mark.debug(False)
+@args_kwargs_quibs_test
+def test_is_there_a_quib_in_args_without_debug(args, kwargs, quibs):
+    assert is_there_a_quib_in_args(args, kwargs) == (len(quibs) > 0)
+
+
+@mark.debug(False)
+def test_is_there_a_quib_in_args_does_not_scan_past_shallow_depth():
+    assert not is_there_a_quib_in_args(([[iquib1]],), {})
+    assert is_there_a_quib_in_args(([iquib1],), dict(a=1))
+
+
+def test_copy_and_replace_quibs_with_vals_copies_mutable_objects_only():
+    inner_list = [1, 2]
+    obj = ('abc', 3.5, inner_list)
+
+    result = copy_and_replace_quibs_with_vals(obj)
+
+    assert result == obj
+    assert result[0] is obj[0] and result[1] is obj[1]
+    assert result[2] is not inner_list
+
+
 def test_copy_and_replace_quibs_with_vals_raises_when_receives_nested_quibs():
     obj = [[[iquib1]]]
     with raises(NestedQuibException, match='.*') as exc_info:
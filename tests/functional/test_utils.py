@@ -1,10 +1,15 @@
+import inspect
 from unittest import mock
 
 import pytest
 import numpy as np
 
+from pyquibbler import iquib
 from pyquibbler.utilities.decorators import ensure_only_run_once_globally
 from pyquibbler.utilities.general_utils import get_shared_shape
+from pyquibbler.function_definitions import FuncArgsKwargs
+from pyquibbler.function_definitions.func_definition import create_or_reuse_func_definition
+from pyquibbler.quib.factory import create_quib
 
 
 def test_ensure_run_once_globally_runs_once():
@@ -27,3 +32,62 @@ def test_ensure_run_once_globally_runs_once():
 ])
 def test_get_shared_shape(shapes, expected):
     assert get_shared_shape([np.zeros(shape) for shape in shapes]) == expected
+
+
+def _func_with_defaults(a, b, c=3, d=4):
+    pass
+
+
+@pytest.mark.parametrize(['func', 'args', 'kwargs'], [
+    (_func_with_defaults, (1, 2), {}),
+    (_func_with_defaults, (1,), {'b': 2, 'd': 5}),
+    (_func_with_defaults, (), {'d': 5, 'a': 1, 'b': 2}),
+    (np.sum, (np.array([1, 2]),), {'axis': 0}),
+    (lambda a, *args, b=2: None, (1, 2, 3), {}),
+])
+@pytest.mark.parametrize('include_defaults', [True, False])
+def test_func_args_kwargs_get_arg_values_by_keyword(func, args, kwargs, include_defaults):
+    bound_args = inspect.signature(func).bind(*args, **kwargs)
+    if include_defaults:
+        bound_args.apply_defaults()
+
+    arg_values_by_keyword = FuncArgsKwargs(func, args, kwargs).get_arg_values_by_keyword(include_defaults)
+
+    assert list(arg_values_by_keyword.keys()) == list(bound_args.arguments.keys())
+
+
+@pytest.mark.parametrize(['args', 'kwargs'], [
+    ((1, 2, 3, 4, 5), {}),
+    ((1,), {}),
+    ((1, 2), {'a': 1}),
+    ((1, 2), {'e': 1}),
+])
+def test_func_args_kwargs_with_arguments_not_matching_the_signature(args, kwargs):
+    assert FuncArgsKwargs(_func_with_defaults, args, kwargs).get_arg_values_by_keyword() == kwargs
+
+
+def test_create_or_reuse_func_definition_does_not_share_derived_definitions():
+    base_func_definition = create_or_reuse_func_definition(raw_data_source_arguments=[0])
+
+    func_definition = create_or_reuse_func_definition(base_func_definition=base_func_definition,
+                                                      raw_data_source_arguments=[1])
+    same_func_definition = create_or_reuse_func_definition(base_func_definition=base_func_definition,
+                                                           raw_data_source_arguments=[1])
+
+    assert func_definition == same_func_definition
+    assert func_definition is not same_func_definition
+
+
+def test_setting_pass_quibs_does_not_affect_quibs_of_functions_with_a_shared_base_definition():
+    base_func_definition = create_or_reuse_func_definition(raw_data_source_arguments=[0])
+    a = iquib(1)
+    first_quib = create_quib(func=mock.Mock(return_value=1), args=(a,),
+                             func_definition=create_or_reuse_func_definition(
+                                 base_func_definition=base_func_definition, is_random=True))
+    second_quib = create_quib(func=mock.Mock(return_value=2), args=(a,),
+                              func_definition=create_or_reuse_func_definition(
+                                  base_func_definition=base_func_definition, is_random=True))
+
+    first_quib.pass_quibs = True
+
+    assert second_quib.pass_quibs is False
@@ -16,6 +16,13 @@ def get_mock_with_repr(repr_value: str):
 slicer = type('Slicer', (), dict(__getitem__=lambda self, item: item))()
 
 
+# [Assignment(path=[PathComponent(1)], value=5)], pickled before PathComponent declared __slots__
+OLD_FORMAT_BINARY_ASSIGNMENTS = \
+    b'\x80\x04\x95\x9a\x00\x00\x00\x00\x00\x00\x00]\x94\x8c pyquibbler.assignment.assignment\x94\x8c\nAssignment' \
+    b'\x94\x93\x94)\x81\x94}\x94(\x8c\x05value\x94K\x05\x8c\x04path\x94]\x94\x8c\x1epyquibbler.path.path_component' \
+    b'\x94\x8c\rPathComponent\x94\x93\x94)\x81\x94}\x94\x8c\tcomponent\x94K\x01sbauba.'
+
+
 @dataclass
 class PathBuilder:
     quib: Quib
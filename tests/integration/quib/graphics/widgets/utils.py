@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from matplotlib.backend_bases import FigureCanvasBase
 from matplotlib.figure import Figure
 
-from pyquibbler.quib.quib import Quib
+from pyquibbler.quib.quib import Quib, QuibHandler
 
 from matplotlib.testing.decorators import image_comparison
 
@@ -35,36 +35,39 @@ def count_canvas_draws(canvas: FigureCanvasBase):
 
 @contextlib.contextmanager
 def count_redraws(widget_quib: Quib):
-    previous_redraw = widget_quib.handler.reevaluate_graphic_quib
+    # QuibHandler uses __slots__, so we patch the class method and count calls of the requested quib only
+    previous_redraw = QuibHandler.reevaluate_graphic_quib
     redraw_count = RedrawCount(0)
 
-    def redraw(*args, **kwargs):
+    def redraw(handler, *args, **kwargs):
         nonlocal redraw_count
-        redraw_count.count += 1
-        return previous_redraw(*args, **kwargs)
-
-    widget_quib.handler.reevaluate_graphic_quib = redraw
-
-    yield redraw_count
+        if handler is widget_quib.handler:
+            redraw_count.count += 1
+        return previous_redraw(handler, *args, **kwargs)
 
-    widget_quib.handler.reevaluate_graphic_quib = previous_redraw
+    QuibHandler.reevaluate_graphic_quib = redraw
+    try:
+        yield redraw_count
+    finally:
+        QuibHandler.reevaluate_graphic_quib = previous_redraw
 
 
 @contextlib.contextmanager
 def count_invalidations(widget_quib: Quib):
-    previous_invalidate_self = widget_quib.handler.invalidate_self
+    previous_invalidate_self = QuibHandler.invalidate_self
     invalidate_count = RedrawCount(0)
 
-    def invalidate(*args, **kwargs):
+    def invalidate(handler, *args, **kwargs):
         nonlocal invalidate_count
-        invalidate_count.count += 1
-        return previous_invalidate_self(*args, **kwargs)
-
-    widget_quib.handler.invalidate_self = invalidate
-
-    yield invalidate_count
-
-    widget_quib.handler.invalidate_self = previous_invalidate_self
+        if handler is widget_quib.handler:
+            invalidate_count.count += 1
+        return previous_invalidate_self(handler, *args, **kwargs)
+
+    QuibHandler.invalidate_self = invalidate
+    try:
+        yield invalidate_count
+    finally:
+        QuibHandler.invalidate_self = previous_invalidate_self
 
 
 quibbler_image_comparison = functools.partial(image_comparison, remove_text=True, extensions=['png'],